@@ -6,28 +6,39 @@ from shared.logger import get_logger
 
 from server.game_manager import get_result_as_string
 
+# Player actions as sent on the wire, shared by ask_decision and handle_client_turn
+_HIT = "Hittt"
+_STAND = "Stand"
+# Accepted answers to the hit/stand prompt (matched after lower-casing)
+_DECISIONS = {'h': _HIT, 'hit': _HIT, 's': _STAND, 'stand': _STAND}
+
 class Client:
     # Input: none
     # Output: initializes client instance
     # Description: Sets networking defaults, game state, and logger.
     def __init__(self):
         self.CLIENT_UDP_PORT = 13122
+        self.UDP_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
 
         self.server_name = None
         self.server_ip = None
         self.server_port = None
         self.server_addr = None
+        self.server_tag = None
 
         self.udp_sock = None
         self.tcp_sock = None
+        self.tcp_reader = None
 
         self.team_name = None
         self.number_of_rounds = 0
-        self.game_stats = {TCP.GAME_CLIENT_WIN_RESULT: 0, TCP.GAME_SERVER_WIN_RESULT: 0, TCP.GAME_TIE_RESULT: 0}
+        # Indexed directly by the result constants (0..3), slot GAME_ROUND_NOT_OVER stays unused
+        self.game_stats = [0] * (TCP.GAME_CLIENT_WIN_RESULT + 1)
 
         self.player_round_sum = 0
 
-        self.client_logger = get_logger()
+        # Synchronous logging: the INPUT prompts have to be on screen before input() blocks
+        self.client_logger = get_logger(background=False)
 
     # Input: none
     # Output: sets server address/name fields
@@ -35,6 +46,10 @@ class Client:
     def discover_server(self):
         self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Lets several clients on the same host listen for offers at once (not available on Windows)
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.UDP_RECEIVE_BUFFER_SIZE)
         self.udp_sock.bind(('', self.CLIENT_UDP_PORT))
 
         self.client_logger.info("UDP Client started. Listening for offers...")
@@ -43,18 +58,23 @@ class Client:
         self.server_name = '"' + self.server_name.rstrip(b'\x00').decode('utf-8') + '"'
         self.server_ip = self.server_addr[0]
         self.server_port = self.server_addr[1]
-        self.client_logger.info(f"Received offer from {self.server_name} at {self.server_ip} on port {self.server_port}")
+        self.client_logger.info("Received offer from %s at %s on port %s", self.server_name, self.server_ip, self.server_port)
 
         self.udp_sock.close()
 
     # Input: none
     # Output: opens TCP connection
-    # Description: Connects to the discovered server using TCP.
+    # Description: Connects to the discovered server using TCP (Nagle disabled for the small per-turn messages).
     def connect_to_server(self):
         self.tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         self.tcp_sock.connect((self.server_ip, self.server_port))
+        TCP.configure_socket(self.tcp_sock)
+        self.server_tag = str(self.server_addr)
+        # One recv() fills the buffer with a whole burst of frames, later reads are memory copies
+        self.tcp_reader = self.tcp_sock.makefile('rb', buffering=4096)
         #self.tcp_sock.timeout(10)
-        self.client_logger.info(f"Connected to: {self.server_addr}")
+        self.client_logger.info("Connected to: %s", self.server_tag)
 
     # Input: input_message (str)
     # Output: user input string
@@ -74,87 +94,102 @@ class Client:
                 self.number_of_rounds = int(self.get_input_from_user("🔢 Number of rounds (1–255):"))
 
                 self.tcp_sock.sendall(TCP.create_request_message(self.team_name, self.number_of_rounds))
-                self.client_logger.info(f"Sent game request to {self.server_addr}")
+                self.client_logger.info("Sent game request to %s", self.server_tag)
 
-                validation = TCP.receive_response(self.tcp_sock, 1, TCP.MSG_TYPE_VALIDATION)
+                validation = TCP.read_response(self.tcp_reader, 1, TCP.MSG_TYPE_VALIDATION)
                 if (not TCP.verify_validation_message(validation, TCP.PAYLOAD_VALID)):
-                    self.client_logger.error(f"Invalid Team Name or Round Numbers sent to Server! {self.server_addr}")
+                    self.client_logger.error("Invalid Team Name or Round Numbers sent to Server! %s", self.server_tag)
                     continue
                 else:
-                    self.client_logger.info(f"Server - {self.server_addr} approved game request")
+                    self.client_logger.info("Server - %s approved game request", self.server_tag)
                     break
             except:
-                self.client_logger.error(f"Invalid Team Name or Round Numbers sent to Server! {self.server_addr}")
+                self.client_logger.error("Invalid Team Name or Round Numbers sent to Server! %s", self.server_tag)
 
     # Input: none
     # Output: "Hittt" or "Stand"
     # Description: Asks the player whether to hit or stand and returns normalized action.
     def ask_decision(self):
         while True:
-            decision = self.get_input_from_user("Hit(H) 😈 / Stand(S) 😎:").lower()
-            if decision in ("h", 'hit'):
-                return "Hittt"
-            if decision in ('s', 'stand'):
-                return "Stand"
+            action = _DECISIONS.get(self.get_input_from_user("Hit(H) 😈 / Stand(S) 😎:").strip().lower())
+            if action is not None:
+                return action
             print("Please type Hit or Stand")
 
     # Input: round_num (int)
     # Output: none
     # Description: Receives initial cards for a round and initializes player/dealer state.
     def init_round(self, round_num):
-        self.client_logger.info(f"{self.server_addr} --- Starting new round {round_num} of {self.number_of_rounds} ---")
-        self.player_round_sum = 0
+        log = self.client_logger.info
+        tag = self.server_tag
+        decode = Card.decode_from_bytes
+        card_size = TCP.MSG_PAYLOAD_CARD_SIZE
+
+        log("%s --- Starting new round %s of %s ---", tag, round_num, self.number_of_rounds)
+
+        # One frame carries the whole opening deal: dealer visible, dealer hidden, your two cards
+        deal = TCP.read_response(self.tcp_reader, TCP.MSG_INIT_DEAL_SIZE, TCP.MSG_TYPE_INIT_DEAL)
+
+        dealer_card = decode(deal[0:card_size])
+        log("%s - Dealer card (visible): %s", tag, dealer_card.emoji_str())
+        self.dealer_revealed_card = dealer_card
 
-        for card_number in range(4):
-            payload = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
-            card = Card.decode_from_bytes(payload)
-
-            match(card_number):
-                case 0:
-                    self.client_logger.info(f"{self.server_addr} - Dealer card (visible): {card.emoji_str()}")
-                    self.dealer_revealed_card = card
-                case 1:
-                    self.client_logger.info(f"{self.server_addr} - Dealer card (hidden): rank=? suit=?")
-                case 2:
-                    self.client_logger.info(f"{self.server_addr} - Your card #1: {card.emoji_str()}")
-                    self.player_round_sum += card.value
-                case 3:
-                    self.client_logger.info(f"{self.server_addr} - Your card #2: {card.emoji_str()}")
-                    self.player_round_sum += card.value
+        # The hidden dealer card is never shown, so it is not decoded
+        log("%s - Dealer card (hidden): rank=? suit=?", tag)
+
+        player_card_1 = decode(deal[2 * card_size:3 * card_size])
+        log("%s - Your card #1: %s", tag, player_card_1.emoji_str())
+
+        player_card_2 = decode(deal[3 * card_size:4 * card_size])
+        log("%s - Your card #2: %s", tag, player_card_2.emoji_str())
+
+        self.player_round_sum = player_card_1.value + player_card_2.value
 
     # Input: none
     # Output: round result constant
     # Description: Plays the client turn: hit/stand loop and bust detection.
     def handle_client_turn(self):
-        result = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
-        result = int.from_bytes(result, byteorder='big')
-        if (result == TCP.GAME_SERVER_WIN_RESULT):
-            self.client_logger.info(f"{self.server_addr} - ROUND LOST: Player busted")
-            return TCP.GAME_SERVER_WIN_RESULT
+        # Bound once so the loop below does not repeat the attribute lookups every turn
+        log = self.client_logger.info
+        tag = self.server_tag
+        reader = self.tcp_reader
+        read = TCP.read_response
+        decode = Card.decode_from_bytes
+        card_size = TCP.MSG_PAYLOAD_CARD_SIZE
+        result_size = TCP.MSG_PAYLOAD_RESULT_SIZE
+        payload_type = TCP.MSG_TYPE_PAYLOAD
+        server_win = TCP.GAME_SERVER_WIN_RESULT
+
+        result = read(reader, result_size, payload_type)
+        result = result[0]
+        if (result == server_win):
+            log("%s - ROUND LOST: Player busted", tag)
+            return server_win
         else:
-            self.client_logger.info(f"{self.server_addr} --- Starting player turn ---")
+            log("%s --- Starting player turn ---", tag)
 
         while True:
-            self.client_logger.info(f"{self.server_addr} - Player current card sum is: {self.player_round_sum}")
+            log("%s - Player current card sum is: %s", tag, self.player_round_sum)
             action = self.ask_decision()
 
-            if action == "Hittt":
-                self.client_logger.info(f"{self.server_addr} - Player decision: hit")
+            if action == _HIT:
+                log("%s - Player decision: hit", tag)
                 self.tcp_sock.sendall(TCP.create_payload_response(action))
 
-                payload = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
-                card = Card.decode_from_bytes(payload)
-                self.client_logger.info(f"{self.server_addr} - Received new card: {card.emoji_str()}")
+                # The server answers a hit with a card frame then a result frame - both come out of the
+                # reader's buffer, so the second read normally costs no extra recv
+                card = decode(read(reader, card_size, payload_type))
+                log("%s - Received new card: %s", tag, card.emoji_str())
                 self.player_round_sum += card.value
 
-                result = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
-                result = int.from_bytes(result, byteorder='big')
-                if (result == TCP.GAME_SERVER_WIN_RESULT):
-                    self.client_logger.info(f"{self.server_addr} - ROUND LOST: Player busted")
-                    return TCP.GAME_SERVER_WIN_RESULT
+                result = read(reader, result_size, payload_type)
+                result = result[0]
+                if (result == server_win):
+                    log("%s - ROUND LOST: Player busted", tag)
+                    return server_win
 
-            elif action == "Stand":
-                self.client_logger.info(f"{self.server_addr} - Player chose to stand")
+            elif action == _STAND:
+                log("%s - Player chose to stand", tag)
                 self.tcp_sock.sendall(TCP.create_payload_response(action))
                 return TCP.GAME_ROUND_NOT_OVER
 
@@ -162,25 +197,33 @@ class Client:
     # Output: final round result constant
     # Description: Handles dealer turn updates received from server until round ends.
     def handle_dealer_turn(self):
-        self.client_logger.info(f"{self.server_addr} --- Starting dealer turn ---")
-
-        self.client_logger.info(f"{self.server_addr} - Dealer revealed card: {self.dealer_revealed_card.emoji_str()}")
-        payload = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
-        hidden_card = Card.decode_from_bytes(payload)
-        self.client_logger.info(f"{self.server_addr} - Revealing dealer's hidden card: {hidden_card.emoji_str()}")
+        log = self.client_logger.info
+        tag = self.server_tag
+        reader = self.tcp_reader
+        read = TCP.read_response
+        decode = Card.decode_from_bytes
+        card_size = TCP.MSG_PAYLOAD_CARD_SIZE
+        result_size = TCP.MSG_PAYLOAD_RESULT_SIZE
+        payload_type = TCP.MSG_TYPE_PAYLOAD
+        not_over = TCP.GAME_ROUND_NOT_OVER
+
+        log("%s --- Starting dealer turn ---", tag)
+
+        log("%s - Dealer revealed card: %s", tag, self.dealer_revealed_card.emoji_str())
+        hidden_card = decode(read(reader, card_size, payload_type))
+        log("%s - Revealing dealer's hidden card: %s", tag, hidden_card.emoji_str())
         
         while True:
-            result = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
-            result = int.from_bytes(result, byteorder='big')
-            if result != TCP.GAME_ROUND_NOT_OVER:
-                self.client_logger.info(f"{self.server_addr} --- Round ended! Result: {get_result_as_string(result)} ---")
+            result = read(reader, result_size, payload_type)
+            result = result[0]
+            if result != not_over:
+                log("%s --- Round ended! Result: %s ---", tag, get_result_as_string(result))
                 return result
                 
-            self.client_logger.info(f"{self.server_addr} - Dealer choses to draw another card.")
+            log("%s - Dealer choses to draw another card.", tag)
 
-            payload = TCP.receive_response(self.tcp_sock, TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
-            card = Card.decode_from_bytes(payload)
-            self.client_logger.info(f"{self.server_addr} - Dealer drew card: {card.emoji_str()}")
+            card = decode(read(reader, card_size, payload_type))
+            log("%s - Dealer drew card: %s", tag, card.emoji_str())
 
     # Input: round_num (int)
     # Output: none
@@ -190,24 +233,24 @@ class Client:
 
         client_result = self.handle_client_turn()
         if client_result == TCP.GAME_SERVER_WIN_RESULT:
-            self.client_logger.info(f"{self.server_addr} --- Round ended! Result: SERVER WINS! ---")
+            self.client_logger.info("%s --- Round ended! Result: SERVER WINS! ---", self.server_tag)
             self.game_stats[TCP.GAME_SERVER_WIN_RESULT] += 1
         else:
             final_result = self.handle_dealer_turn()
             self.game_stats[final_result] += 1
 
-        self.client_logger.info(f"{self.server_addr} --- Round {round_num} complete ---\n")
+        self.client_logger.info("%s --- Round %s complete ---\n", self.server_tag, round_num)
 
     # Input: none
     # Output: none
     # Description: Plays all rounds for the game and prints final win rate.
     def play_game(self):
-        self.client_logger.info(f"{self.server_addr} --- Game started for team: {self.team_name} with {self.number_of_rounds} rounds ---")
+        self.client_logger.info("%s --- Game started for team: %s with %s rounds ---", self.server_tag, self.team_name, self.number_of_rounds)
 
         for i in range(self.number_of_rounds):
             self.play_round(i + 1)
 
-        self.client_logger.info(f"{self.server_addr} --- Finished playing {self.number_of_rounds} rounds, win rate: {self.game_stats[TCP.GAME_CLIENT_WIN_RESULT] / self.number_of_rounds}")
+        self.client_logger.info("%s --- Finished playing %s rounds, win rate: %s", self.server_tag, self.number_of_rounds, self.game_stats[TCP.GAME_CLIENT_WIN_RESULT] / self.number_of_rounds)
                                 
     # Input: none
     # Output: none
@@ -221,11 +264,13 @@ class Client:
         except ConnectionResetError:
             self.client_logger.error("Connection lost to server")
         except Exception as ex:
-            self.client_logger.error(f"Error: {ex}")
+            self.client_logger.error("Error: %s", ex)
         finally:
+            if self.tcp_reader:
+                self.tcp_reader.close()
             if self.tcp_sock:
                 self.tcp_sock.close()
-            self.client_logger.info(f"Disconnected from server: {self.server_addr}")
+            self.client_logger.info("Disconnected from server: %s", self.server_addr)
 
 # Input: none
 # Output: none
@@ -0,0 +1,75 @@
+"""
+Card HTML helpers for the Streamlit client
+
+Pure string building with no Streamlit dependency, kept apart from ui.py so it can be
+imported (and profiled or compiled) on its own. The markup relies on the card classes
+(hand, pcard, crk, csym) defined in the page stylesheet injected by ui.py.
+"""
+
+import functools
+from typing import Dict, List, Tuple
+
+
+# Seconds between the cards of a hand dealt in one render
+DEAL_STAGGER = 0.6
+
+
+# Suit alias -> (symbol, color), one entry per accepted spelling
+_SUIT_TABLE: Dict[str, Tuple[str, str]] = {
+    alias: (symbol, color)
+    for aliases, symbol, color in (
+        (("H", "HEARTS", "HEART", "♥"), "♥", "#e63946"),
+        (("D", "DIAMONDS", "DIAMOND", "♦"), "♦", "#e63946"),
+        (("C", "CLUBS", "CLUB", "♣"), "♣", "#1d3557"),
+        (("S", "SPADES", "SPADE", "♠"), "♠", "#1d3557"),
+    )
+    for alias in aliases
+}
+
+
+def get_suit_symbol(suit: str) -> Tuple[str, str]:
+    """Returns (symbol, color) for a suit"""
+    return _SUIT_TABLE.get(str(suit).upper().strip(), (suit, "#1d3557"))
+
+
+@functools.lru_cache(maxsize=256)
+def card_html(rank: str, suit: str, hidden: bool = False, animate: bool = False, delay: float = 0.0) -> str:
+    """Generate HTML for a playing card with optional animation (memoized - the inputs are a small closed set)"""
+    # Layout and look come from the pcard classes in the page stylesheet, only the suit colour and deal delay are per card
+    deal = " deal" if animate else ""
+    delay_style = f"animation-delay:{delay}s;" if animate and delay else ""
+    
+    if hidden:
+        style = f' style="{delay_style}"' if delay_style else ""
+        return f'<div class="pcard back{deal}"{style}><span class="csym">🂠</span></div>'
+    
+    sym, col = get_suit_symbol(suit)
+    
+    return (
+        f'<div class="pcard face{deal}" style="color:{col};{delay_style}">'
+        f'<span class="crk tl">{rank}</span><span class="csym">{sym}</span><span class="crk br">{rank}</span></div>'
+    )
+
+
+def cards_html(cards: List[dict], hide_second: bool = False, new_card_index: int = -1) -> str:
+    """Render cards, animating the new ones (new_card_index onwards) dealt one after another"""
+    if not cards:
+        return '<div class="no-cards">No cards</div>'
+
+    hand = tuple((str(c.get("rank", "?")), str(c.get("suit", "?"))) for c in cards)
+    return _hand_html(hand, hide_second, new_card_index)
+
+
+@functools.lru_cache(maxsize=512)
+def _hand_html(hand: Tuple[Tuple[str, str], ...], hide_second: bool, new_card_index: int) -> str:
+    """Memoized HTML for a hand given as a tuple of (rank, suit) pairs"""
+    parts = ['<div class="hand">']
+    for i, (rank, suit) in enumerate(hand):
+        animate = 0 <= new_card_index <= i
+        delay = (i - new_card_index) * DEAL_STAGGER if animate else 0.0
+        if hide_second and i == 1:
+            parts.append(card_html("", "", hidden=True, animate=animate, delay=delay))
+        else:
+            parts.append(card_html(rank, suit, animate=animate, delay=delay))
+    parts.append("</div>")
+    return "".join(parts)
@@ -5,20 +5,24 @@ Matches ClientCLI.py protocol with smooth animations
 Flow: Connect to Server -> Enter Name/Rounds -> Play Game
 """
 
+import collections
+import itertools
 import os
+import re
+import select
 import socket
-import subprocess
 import time
-import json
 import sys
-from typing import Optional, List
+from typing import Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import streamlit as st
 
 from shared.card import Card
-from shared.packets import TCP, UDP
+from shared.packets import TCP, TCPFramer, UDP
+
+from client.render import cards_html
 
 # States
 STATE_DISCONNECTED = "disconnected"
@@ -35,60 +39,9 @@ RESULT_TIE = 0x01
 RESULT_SERVER_WIN = 0x02
 RESULT_CLIENT_WIN = 0x03
 
-
-def get_suit_symbol(suit: str) -> tuple:
-    """Returns (symbol, color) for a suit"""
-    suit_upper = str(suit).upper().strip()
-    if suit_upper in ["H", "HEARTS", "HEART", "♥"]:
-        return ("♥", "#e63946")
-    elif suit_upper in ["D", "DIAMONDS", "DIAMOND", "♦"]:
-        return ("♦", "#e63946")
-    elif suit_upper in ["C", "CLUBS", "CLUB", "♣"]:
-        return ("♣", "#1d3557")
-    elif suit_upper in ["S", "SPADES", "SPADE", "♠"]:
-        return ("♠", "#1d3557")
-    else:
-        return (suit, "#1d3557")
-
-
-def card_html(rank: str, suit: str, hidden: bool = False, animate: bool = False) -> str:
-    """Generate HTML for a playing card with optional animation"""
-    animation_style = ""
-    if animate:
-        animation_style = "animation: cardDeal 0.5s ease-out;"
-    
-    if hidden:
-        return f'''<div style="width:75px;height:105px;background:linear-gradient(135deg,#1a1a2e 0%,#16213e 100%);
-            border-radius:10px;display:inline-flex;align-items:center;justify-content:center;margin:5px;
-            border:2px solid #0f3460;box-shadow:0 4px 15px rgba(0,0,0,0.3);{animation_style}">
-            <span style="font-size:40px;color:#e94560;">🂠</span></div>'''
-    
-    sym, col = get_suit_symbol(suit)
-    
-    return f'''<div style="width:75px;height:105px;background:linear-gradient(145deg,#ffffff 0%,#f8f9fa 100%);
-        border-radius:10px;display:inline-flex;flex-direction:column;align-items:center;justify-content:center;
-        margin:5px;border:1px solid #dee2e6;position:relative;box-shadow:0 4px 15px rgba(0,0,0,0.2);{animation_style}">
-        <span style="position:absolute;top:6px;left:8px;font-size:14px;font-weight:bold;color:{col};
-            font-family:Georgia,serif;">{rank}</span>
-        <span style="font-size:36px;color:{col};">{sym}</span>
-        <span style="position:absolute;bottom:6px;right:8px;font-size:14px;font-weight:bold;color:{col};
-            font-family:Georgia,serif;transform:rotate(180deg);">{rank}</span></div>'''
-
-
-def cards_html(cards: List[dict], hide_second: bool = False, new_card_index: int = -1) -> str:
-    """Render cards with optional animation for new card"""
-    if not cards:
-        return '<div style="color:#888;font-style:italic;">No cards</div>'
-    
-    html = '<div style="display:flex;flex-wrap:wrap;justify-content:center;align-items:center;">'
-    for i, c in enumerate(cards):
-        animate = (i == new_card_index)
-        if hide_second and i == 1:
-            html += card_html("", "", hidden=True, animate=animate)
-        else:
-            html += card_html(str(c.get("rank", "?")), str(c.get("suit", "?")), animate=animate)
-    html += "</div>"
-    return html
+# Log lines kept in the session / shown in the log box
+LOG_HISTORY = 30
+LOG_VISIBLE = 15
 
 
 def get_result_string(result: int) -> tuple:
@@ -103,68 +56,52 @@ def get_result_string(result: int) -> tuple:
         return ("???", "tie")
 
 
-# ============ DISCOVERY SCRIPT (runs as separate process) ============
-DISCOVERY_SCRIPT = '''
-import socket
-import struct
-import json
+# ============ DISCOVERY ============
+DISCOVERY_UDP_PORT = 13122
+DISCOVERY_TIMEOUT = 15.0
+# Room for a burst of offers; the kernel silently caps this at its configured maximum (net.core.rmem_max)
+DISCOVERY_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
 
-MAGIC_COOKIE = 0xabcddcba
-OFFER_MESSAGE_TYPE = 0x02
-UDP_PORT = 13122
-TIMEOUT = 15
 
-result = {"status": "searching"}
+# The wait is sliced so the progress bar redraws while listening. A Cancel click reruns the script, and Streamlit
+# stops this run at the next redraw - so the slice length is also how long a cancel takes to land
+DISCOVERY_POLL_INTERVAL = 0.25
 
-try:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    sock.settimeout(2.0)
-    sock.bind(('', UDP_PORT))
-    
-    start = __import__('time').time()
-    while __import__('time').time() - start < TIMEOUT:
-        try:
-            data, addr = sock.recvfrom(1024)
-            if len(data) >= 7:
-                magic, msg_type, port = struct.unpack("!IBH", data[:7])
-                if magic == MAGIC_COOKIE and msg_type == OFFER_MESSAGE_TYPE:
-                    result = {"status": "found", "ip": addr[0], "port": port}
-                    break
-        except socket.timeout:
-            continue
-    else:
-        result = {"status": "timeout"}
-except Exception as e:
-    result = {"status": "error", "error": str(e)}
-finally:
-    try:
-        sock.close()
-    except:
-        pass
-
-print(json.dumps(result))
-'''
 
+def run_discovery(timeout: float = DISCOVERY_TIMEOUT, on_wait=None) -> dict:
+    """Listen for a server UDP offer in-process. Returns {"status": "found", "ip", "port"}, "timeout" or "error".
 
-def run_discovery_subprocess() -> dict:
-    """Run UDP discovery in a separate Python process"""
+    on_wait(remaining) is called before every wait slice.
+    """
+    sock = None
     try:
-        result = subprocess.run(
-            [sys.executable, '-c', DISCOVERY_SCRIPT],
-            capture_output=True,
-            text=True,
-            timeout=20
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout.strip())
-        else:
-            return {"status": "error", "error": result.stderr.strip() if result.stderr else "Unknown error"}
-    except subprocess.TimeoutExpired:
-        return {"status": "timeout"}
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, DISCOVERY_RECEIVE_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.bind(('', DISCOVERY_UDP_PORT))
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {"status": "timeout"}
+            if on_wait is not None:
+                on_wait(remaining)
+            ready, _, _ = select.select([sock], [], [], min(remaining, DISCOVERY_POLL_INTERVAL))
+            if not ready:
+                continue
+            data, addr = sock.recvfrom(1024)
+            if len(data) >= UDP.OFFER_HEADER_STRUCT.size and data.startswith(UDP.OFFER_PREFIX):
+                _, _, port = UDP.OFFER_HEADER_STRUCT.unpack_from(data)
+                return {"status": "found", "ip": addr[0], "port": port}
     except Exception as e:
         return {"status": "error", "error": str(e)}
+    finally:
+        if sock is not None:
+            sock.close()
 
 
 class SocketManager:
@@ -175,25 +112,35 @@ class SocketManager:
         self.server_ip: Optional[str] = None
         self.server_port: Optional[int] = None
         self.dealer_revealed_card: Optional[dict] = None
+        # Buffers whatever the server sent ahead (e.g. a whole dealer turn) between reads
+        self._framer = TCPFramer()
     
     def connect_tcp(self, ip: str, port: int) -> bool:
         self.server_ip = ip
         self.server_port = port
+        self._framer.reset()
         try:
             self.tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.tcp_sock.settimeout(10.0)
             self.tcp_sock.connect((ip, port))
+            # Tiny hit/stand messages each wait for a reply - don't let Nagle hold them back
+            TCP.configure_socket(self.tcp_sock)
             self.tcp_sock.settimeout(60.0)
             return True
         except Exception as e:
             print(f"TCP connect error: {e}")
             return False
     
+    def _receive(self, payload_size: int, message_type: int):
+        """Receive the next frame's payload, served from the framer's buffer when it is already there"""
+        return self._framer.feed_and_parse(self.tcp_sock, payload_size, message_type, (self.server_ip, self.server_port))
+    
     def send_settings(self, team: str, rounds: int) -> bool:
         """Send game settings and verify validation"""
         try:
             self.tcp_sock.sendall(TCP.create_request_message(team, rounds))
-            validation = TCP.receive_response(self.tcp_sock, 1, TCP.MSG_TYPE_VALIDATION)
+            validation = self._receive(1, TCP.MSG_TYPE_VALIDATION)
             return TCP.verify_validation_message(validation, TCP.PAYLOAD_VALID)
         except Exception as e:
             print(f"Send settings error: {e}")
@@ -204,12 +151,11 @@ class SocketManager:
         Receive 4 initial cards.
         Returns: (dealer_visible, dealer_hidden, player_card1, player_card2)
         """
-        cards = []
         try:
-            for _ in range(4):
-                payload = TCP.receive_response(self.tcp_sock, 3, TCP.MSG_TYPE_PAYLOAD)
-                card = Card.decode_from_bytes(payload)
-                cards.append({"rank": card.rank, "suit": card.suit, "value": card.value})
+            # The whole opening deal arrives as one frame
+            deal = self._receive(TCP.MSG_INIT_DEAL_SIZE, TCP.MSG_TYPE_INIT_DEAL)
+            size = TCP.MSG_PAYLOAD_CARD_SIZE
+            cards = [Card.decode_dict(deal[i:i + size]) for i in range(0, TCP.MSG_INIT_DEAL_SIZE, size)]
             
             # Store dealer's visible card for later
             self.dealer_revealed_card = cards[0]
@@ -221,8 +167,8 @@ class SocketManager:
     def check_initial_bust(self) -> int:
         """Check if player busted on initial deal (21+ with first 2 cards)"""
         try:
-            result = TCP.receive_response(self.tcp_sock, 1, TCP.MSG_TYPE_PAYLOAD)
-            return int.from_bytes(result, byteorder='big')
+            result = self._receive(TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            return result[0]
         except Exception as e:
             print(f"Check initial bust error: {e}")
             return -1
@@ -233,13 +179,12 @@ class SocketManager:
             self.tcp_sock.sendall(TCP.create_payload_response("Hittt"))
             
             # Receive new card
-            payload = TCP.receive_response(self.tcp_sock, 3, TCP.MSG_TYPE_PAYLOAD)
-            card = Card.decode_from_bytes(payload)
-            card_dict = {"rank": card.rank, "suit": card.suit, "value": card.value}
+            payload = self._receive(TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            card_dict = Card.decode_dict(payload)
             
             # Receive result
-            result = TCP.receive_response(self.tcp_sock, 1, TCP.MSG_TYPE_PAYLOAD)
-            result_code = int.from_bytes(result, byteorder='big')
+            result = self._receive(TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            result_code = result[0]
             
             return (card_dict, result_code)
         except Exception as e:
@@ -258,9 +203,8 @@ class SocketManager:
     def receive_dealer_hidden_card(self) -> dict:
         """Receive the dealer's hidden card reveal"""
         try:
-            payload = TCP.receive_response(self.tcp_sock, 3, TCP.MSG_TYPE_PAYLOAD)
-            card = Card.decode_from_bytes(payload)
-            return {"rank": card.rank, "suit": card.suit, "value": card.value}
+            payload = self._receive(TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            return Card.decode_dict(payload)
         except Exception as e:
             print(f"Receive hidden card error: {e}")
             return None
@@ -268,8 +212,8 @@ class SocketManager:
     def receive_dealer_result(self) -> int:
         """Receive dealer turn result. Returns result code."""
         try:
-            result = TCP.receive_response(self.tcp_sock, 1, TCP.MSG_TYPE_PAYLOAD)
-            return int.from_bytes(result, byteorder='big')
+            result = self._receive(TCP.MSG_PAYLOAD_RESULT_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            return result[0]
         except Exception as e:
             print(f"Receive dealer result error: {e}")
             return -1
@@ -277,13 +221,23 @@ class SocketManager:
     def receive_dealer_card(self) -> dict:
         """Receive a dealer card"""
         try:
-            payload = TCP.receive_response(self.tcp_sock, 3, TCP.MSG_TYPE_PAYLOAD)
-            card = Card.decode_from_bytes(payload)
-            return {"rank": card.rank, "suit": card.suit, "value": card.value}
+            payload = self._receive(TCP.MSG_PAYLOAD_CARD_SIZE, TCP.MSG_TYPE_PAYLOAD)
+            return Card.decode_dict(payload)
         except Exception as e:
             print(f"Receive dealer card error: {e}")
             return None
     
+    def play_dealer_turn(self, on_card) -> int:
+        """Receive dealer draws until the round result arrives, calling on_card(card_dict) per draw. Returns result code."""
+        while True:
+            result = self.receive_dealer_result()
+            if result != RESULT_NOT_OVER:
+                return result
+            card = self.receive_dealer_card()
+            if card is None:
+                return -1
+            on_card(card)
+    
     def close(self):
         if self.tcp_sock:
             try:
@@ -291,6 +245,7 @@ class SocketManager:
             except:
                 pass
             self.tcp_sock = None
+        self._framer.reset()
 
 
 @st.cache_resource
@@ -310,7 +265,7 @@ def init_state():
         "dealer_cards": [],
         "player_sum": 0,
         "result": None,
-        "logs": [],
+        "logs": collections.deque(maxlen=LOG_HISTORY),
         "wins": 0,
         "losses": 0,
         "ties": 0,
@@ -322,9 +277,16 @@ def init_state():
             st.session_state[k] = v
 
 
-def log(msg):
-    st.session_state.logs.append(f"[{time.strftime('%H:%M:%S')}] {msg}")
-    st.session_state.logs = st.session_state.logs[-30:]
+def log(msg, *args):
+    """Record a log line; like logging, msg is %-formatted with args"""
+    # Formatted once here - the log panel is drawn on every rerun. Bounded deque: the oldest line drops off on its own
+    st.session_state.logs.append(f"[{time.strftime('%H:%M:%S')}] {msg % args if args else msg}")
+
+
+def cancel_discovery():
+    """Cancel button callback: go back to the connect screen (the click's rerun already ended the discovery wait)"""
+    log("🛑 Discovery cancelled")
+    st.session_state.state = STATE_DISCONNECTED
 
 
 def reset():
@@ -339,11 +301,15 @@ def reset():
     st.session_state.wins = 0
     st.session_state.losses = 0
     st.session_state.ties = 0
-    st.session_state.logs = []
+    st.session_state.logs = collections.deque(maxlen=LOG_HISTORY)
     st.session_state.new_card_index = -1
     st.session_state.dealer_new_card_index = -1
 
 
+def finish_game():
+    st.session_state.state = STATE_GAME_OVER
+
+
 def update_stats(result: int):
     """Update win/loss/tie stats based on result code"""
     if result == RESULT_CLIENT_WIN:
@@ -354,9 +320,7 @@ def update_stats(result: int):
         st.session_state.ties += 1
 
 
-def inject_css():
-    """Inject CSS with animations"""
-    st.markdown("""
+_APP_CSS = """
     <style>
     @keyframes cardDeal {
         0% { transform: translateY(-50px) rotate(-10deg); opacity: 0; }
@@ -508,14 +472,6 @@ def inject_css():
     .on { background: rgba(76,175,80,0.2); border: 1px solid #4caf50; color: #4caf50; }
     .srch { background: rgba(255,152,0,0.2); border: 1px solid #ff9800; color: #ff9800; }
     
-    .dealer-drawing {
-        text-align: center;
-        color: #ff9800;
-        font-size: 1.3rem;
-        margin: 1rem 0;
-        animation: pulse 1s ease-in-out infinite;
-    }
-    
     .card-area {
         min-height: 130px;
         display: flex;
@@ -523,53 +479,110 @@ def inject_css():
         justify-content: center;
         padding: 0.5rem;
     }
+    
+    /* Playing cards - see client/render.py */
+    .hand { display: flex; flex-wrap: wrap; justify-content: center; align-items: center; }
+    .no-cards { color: #888; font-style: italic; }
+    
+    .pcard {
+        width: 75px;
+        height: 105px;
+        border-radius: 10px;
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        margin: 5px;
+    }
+    .pcard.face {
+        background: linear-gradient(145deg, #ffffff 0%, #f8f9fa 100%);
+        flex-direction: column;
+        border: 1px solid #dee2e6;
+        position: relative;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }
+    .pcard.back {
+        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+        border: 2px solid #0f3460;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.3);
+    }
+    /* both: a card with an animation-delay stays hidden until its turn to be dealt */
+    .pcard.deal { animation: cardDeal 0.5s ease-out both; }
+    
+    .pcard .csym { font-size: 36px; }
+    .pcard.back .csym { font-size: 40px; color: #e94560; }
+    .pcard .crk { position: absolute; font-size: 14px; font-weight: bold; font-family: Georgia, serif; }
+    .pcard .crk.tl { top: 6px; left: 8px; }
+    .pcard .crk.br { bottom: 6px; right: 8px; transform: rotate(180deg); }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _css_blob() -> str:
+    """Whitespace-collapsed stylesheet, computed once per server process"""
+    # cache_resource hands back the same immutable str on every rerun; cache_data would unpickle a fresh copy each time
+    return re.sub(r"\s+", " ", _APP_CSS).strip()
+
+
+def inject_css():
+    """Inject CSS with animations"""
+    # Emitted on every rerun on purpose: Streamlit removes elements a rerun doesn't re-emit,
+    # so a once-per-session guard would drop the styling after the first interaction.
+    st.markdown(_css_blob(), unsafe_allow_html=True)
+
+
+_STATS_TMPL = (
+    '<div class="stats">'
+    '<div class="sbox"><div class="slbl">Round</div><div class="sval">{cur_round}/{rounds}</div></div>'
+    '<div class="sbox"><div class="slbl">Wins</div><div class="sval" style="color:#4caf50;">{wins}</div></div>'
+    '<div class="sbox"><div class="slbl">Losses</div><div class="sval" style="color:#f44336;">{losses}</div></div>'
+    '<div class="sbox"><div class="slbl">Ties</div><div class="sval" style="color:#ff9800;">{ties}</div></div>'
+    '</div>'
+)
+
+_GAME_OVER_STATS_TMPL = (
+    '<div class="stats">'
+    '<div class="sbox"><div class="slbl">Wins</div><div class="sval" style="color:#4caf50;">{wins}</div></div>'
+    '<div class="sbox"><div class="slbl">Losses</div><div class="sval" style="color:#f44336;">{losses}</div></div>'
+    '<div class="sbox"><div class="slbl">Ties</div><div class="sval" style="color:#ff9800;">{ties}</div></div>'
+    '<div class="sbox"><div class="slbl">Win Rate</div><div class="sval" style="color:#ffd700;">{win_rate:.0f}%</div></div>'
+    '</div>'
+)
 
 
 def render_stats():
-    st.markdown(f'''<div class="stats">
-        <div class="sbox"><div class="slbl">Round</div><div class="sval">{st.session_state.cur_round}/{st.session_state.rounds}</div></div>
-        <div class="sbox"><div class="slbl">Wins</div><div class="sval" style="color:#4caf50;">{st.session_state.wins}</div></div>
-        <div class="sbox"><div class="slbl">Losses</div><div class="sval" style="color:#f44336;">{st.session_state.losses}</div></div>
-        <div class="sbox"><div class="slbl">Ties</div><div class="sval" style="color:#ff9800;">{st.session_state.ties}</div></div>
-    </div>''', unsafe_allow_html=True)
+    st.markdown(_STATS_TMPL.format_map(st.session_state), unsafe_allow_html=True)
 
 
-def render_table(hide_dealer: bool = True, dealer_drawing: bool = False):
-    st.markdown('<div class="table">', unsafe_allow_html=True)
-    
-    # Dealer label
-    if dealer_drawing:
-        st.markdown('<div class="lbl">🎩 DEALER (Drawing...)</div>', unsafe_allow_html=True)
-    else:
-        st.markdown('<div class="lbl">🎩 DEALER</div>', unsafe_allow_html=True)
-    
-    # Dealer cards
+def render_table(hide_dealer: bool = True):
     dealer_html = cards_html(
         st.session_state.dealer_cards, 
         hide_second=hide_dealer,
         new_card_index=st.session_state.dealer_new_card_index
     )
-    st.markdown(f'<div class="card-area">{dealer_html}</div>', unsafe_allow_html=True)
-    
-    st.markdown('<hr style="border-color:rgba(255,215,0,0.3);margin:1rem 0;">', unsafe_allow_html=True)
-    
-    # Player
-    st.markdown('<div class="lbl">🎴 YOUR HAND</div>', unsafe_allow_html=True)
     player_html = cards_html(
         st.session_state.player_cards,
         new_card_index=st.session_state.new_card_index
     )
-    st.markdown(f'<div class="card-area">{player_html}</div>', unsafe_allow_html=True)
-    st.markdown(f'<div style="text-align:center;"><span class="score">Total: {st.session_state.player_sum}</span></div>', unsafe_allow_html=True)
     
-    st.markdown('</div>', unsafe_allow_html=True)
+    # One element for the whole table: a single node for Streamlit to diff, and the
+    # wrapping div actually contains the hands instead of being closed by its own st.markdown
+    st.markdown(
+        '<div class="table"><div class="lbl">🎩 DEALER</div>'
+        f'<div class="card-area">{dealer_html}</div>'
+        '<hr style="border-color:rgba(255,215,0,0.3);margin:1rem 0;">'
+        '<div class="lbl">🎴 YOUR HAND</div>'
+        f'<div class="card-area">{player_html}</div>'
+        f'<div style="text-align:center;"><span class="score">Total: {st.session_state.player_sum}</span></div></div>',
+        unsafe_allow_html=True
+    )
 
 
 def render_logs():
     if st.session_state.logs:
-        st.markdown('<div class="logbox">' + '<br>'.join(st.session_state.logs[-15:]) + '</div>', unsafe_allow_html=True)
+        logs = st.session_state.logs
+        recent = itertools.islice(logs, max(0, len(logs) - LOG_VISIBLE), None)
+        st.markdown('<div class="logbox">' + '<br>'.join(recent) + '</div>', unsafe_allow_html=True)
 
 
 def main():
@@ -609,7 +622,7 @@ def main():
                     st.session_state.server_port = int(server_port)
                     sm.server_ip = server_ip
                     sm.server_port = int(server_port)
-                    log(f"📡 Server set to {server_ip}:{server_port}")
+                    log("📡 Server set to %s:%s", server_ip, server_port)
                     st.session_state.state = STATE_SERVER_FOUND
                     st.rerun()
             
@@ -621,15 +634,16 @@ def main():
         with col2:
             st.markdown('<div class="stbox srch">🔍 Searching for server...</div>', unsafe_allow_html=True)
             
-            with st.spinner("Running UDP discovery..."):
-                result = run_discovery_subprocess()
+            st.button("✖ Cancel", use_container_width=True, key="cancel_discovery", on_click=cancel_discovery)
+            progress = st.progress(0.0, text="Running UDP discovery...")
+            result = run_discovery(on_wait=lambda remaining: progress.progress(1.0 - remaining / DISCOVERY_TIMEOUT, text="Running UDP discovery..."))
             
             if result["status"] == "found":
                 st.session_state.server_ip = result["ip"]
                 st.session_state.server_port = result["port"]
                 sm.server_ip = result["ip"]
                 sm.server_port = result["port"]
-                log(f"✅ Found server: {result['ip']}:{result['port']}")
+                log("✅ Found server: %s:%s", result['ip'], result['port'])
                 st.session_state.state = STATE_SERVER_FOUND
                 st.rerun()
             elif result["status"] == "timeout":
@@ -639,7 +653,7 @@ def main():
                 time.sleep(2)
                 st.rerun()
             else:
-                log(f"❌ Error: {result.get('error', 'Unknown')}")
+                log("❌ Error: %s", result.get('error', 'Unknown'))
                 st.error(f"Discovery error. Try manual connection.")
                 st.session_state.state = STATE_DISCONNECTED
                 time.sleep(2)
@@ -663,7 +677,7 @@ def main():
                     if not team or len(team) < 1:
                         st.error("Enter a team name!")
                     else:
-                        log(f"🔗 Connecting to {ip}:{port}...")
+                        log("🔗 Connecting to %s:%s...", ip, port)
                         if sm.connect_tcp(ip, port):
                             log("✅ TCP connected")
                             if sm.send_settings(team, rounds):
@@ -706,7 +720,7 @@ def main():
                         st.session_state.player_cards.append(card)
                         st.session_state.player_sum += card["value"]
                         st.session_state.new_card_index = len(st.session_state.player_cards) - 1
-                        log(f"🎴 Drew {card['rank']} of {card['suit']} | Total: {st.session_state.player_sum}")
+                        log("🎴 Drew %s of %s | Total: %s", card['rank'], card['suit'], st.session_state.player_sum)
                         
                         if result == RESULT_SERVER_WIN:
                             log("💥 BUST! You lose this round.")
@@ -731,49 +745,28 @@ def main():
     
     # ==================== DEALER TURN ====================
     elif state == STATE_DEALER_TURN:
-        render_stats()
-        
         # First, reveal hidden card if not done yet
         if len(st.session_state.dealer_cards) == 2 and st.session_state.dealer_cards[1].get("rank") == "?":
             # Reveal hidden card
             hidden_card = sm.receive_dealer_hidden_card()
             if hidden_card:
                 st.session_state.dealer_cards[1] = hidden_card
-                st.session_state.dealer_new_card_index = 1
-                log(f"🔓 Dealer reveals: {hidden_card['rank']} of {hidden_card['suit']}")
-        
-        render_table(hide_dealer=False, dealer_drawing=True)
-        
-        st.markdown('<div class="dealer-drawing">🎰 Dealer is playing...</div>', unsafe_allow_html=True)
-        
-        render_logs()
-        
-        # Small delay for animation
-        time.sleep(1.0)
-        
-        # Receive result first (as per new protocol)
-        result = sm.receive_dealer_result()
-        
-        if result != RESULT_NOT_OVER:
-            # Round is over
-            result_str, _ = get_result_string(result)
-            log(f"🎲 Round ended: {result_str}")
-            st.session_state.result = result
-            update_stats(result)
-            st.session_state.dealer_new_card_index = -1
-            st.session_state.state = STATE_ROUND_END
-            st.rerun()
-        else:
-            # Dealer draws another card
-            log("🃏 Dealer draws another card...")
-            card = sm.receive_dealer_card()
-            if card:
-                st.session_state.dealer_cards.append(card)
-                st.session_state.dealer_new_card_index = len(st.session_state.dealer_cards) - 1
-                log(f"🃏 Dealer drew: {card['rank']} of {card['suit']}")
-            
-            # Stay in dealer turn state
-            st.rerun()
+                log("🔓 Dealer reveals: %s of %s", hidden_card['rank'], hidden_card['suit'])
+
+        def on_dealer_card(card: dict):
+            st.session_state.dealer_cards.append(card)
+            log("🃏 Dealer drew: %s of %s", card['rank'], card['suit'])
+
+        # The server sends the whole dealer turn at once - drain it here and go straight to the round end
+        result = sm.play_dealer_turn(on_dealer_card)
+        result_str, _ = get_result_string(result)
+        log("🎲 Round ended: %s", result_str)
+        st.session_state.result = result
+        update_stats(result)
+        # The result screen deals the revealed card and every draw one after another
+        st.session_state.dealer_new_card_index = 1
+        st.session_state.state = STATE_ROUND_END
+        st.rerun()
     
     # ==================== ROUND END ====================
     elif state == STATE_ROUND_END:
@@ -784,18 +777,14 @@ def main():
         result_str, result_class = get_result_string(st.session_state.result)
         st.markdown(f'<div class="{result_class}">{result_str}</div>', unsafe_allow_html=True)
         
+        # Callbacks run before the rerun the click triggers, so that single rerun already draws the
+        # next screen - no second full pass through st.rerun()
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.session_state.cur_round < st.session_state.rounds:
-                if st.button("▶️ Next Round", use_container_width=True, type="primary", key="next"):
-                    st.session_state.new_card_index = -1
-                    st.session_state.dealer_new_card_index = -1
-                    start_new_round(sm)
-                    st.rerun()
+                st.button("▶️ Next Round", use_container_width=True, type="primary", key="next", on_click=start_new_round, args=(sm,))
             else:
-                if st.button("🏁 Finish Game", use_container_width=True, type="primary", key="finish"):
-                    st.session_state.state = STATE_GAME_OVER
-                    st.rerun()
+                st.button("🏁 Finish Game", use_container_width=True, type="primary", key="finish", on_click=finish_game)
         
         render_logs()
     
@@ -808,18 +797,13 @@ def main():
             total = st.session_state.wins + st.session_state.losses + st.session_state.ties
             wr = (st.session_state.wins / total * 100) if total > 0 else 0
             
-            st.markdown(f'''<div class="stats">
-                <div class="sbox"><div class="slbl">Wins</div><div class="sval" style="color:#4caf50;">{st.session_state.wins}</div></div>
-                <div class="sbox"><div class="slbl">Losses</div><div class="sval" style="color:#f44336;">{st.session_state.losses}</div></div>
-                <div class="sbox"><div class="slbl">Ties</div><div class="sval" style="color:#ff9800;">{st.session_state.ties}</div></div>
-                <div class="sbox"><div class="slbl">Win Rate</div><div class="sval" style="color:#ffd700;">{wr:.0f}%</div></div>
-            </div>''', unsafe_allow_html=True)
+            st.markdown(_GAME_OVER_STATS_TMPL.format(
+                wins=st.session_state.wins, losses=st.session_state.losses, ties=st.session_state.ties, win_rate=wr
+            ), unsafe_allow_html=True)
             
             st.markdown("<br>", unsafe_allow_html=True)
             
-            if st.button("🔄 Play Again", use_container_width=True, type="primary", key="again"):
-                reset()
-                st.rerun()
+            st.button("🔄 Play Again", use_container_width=True, type="primary", key="again", on_click=reset)
         
         render_logs()
     
@@ -840,7 +824,7 @@ def start_new_round(sm: SocketManager):
     st.session_state.new_card_index = -1
     st.session_state.dealer_new_card_index = -1
     
-    log(f"🎰 === Round {st.session_state.cur_round}/{st.session_state.rounds} ===")
+    log("🎰 === Round %s/%s ===", st.session_state.cur_round, st.session_state.rounds)
     
     cards = sm.init_round()
     if cards and len(cards) == 4:
@@ -849,16 +833,16 @@ def start_new_round(sm: SocketManager):
         # Dealer cards
         st.session_state.dealer_cards.append(dealer_visible)
         st.session_state.dealer_cards.append({"rank": "?", "suit": "?", "value": 0})  # Hidden
-        log(f"🃏 Dealer shows: {dealer_visible['rank']} of {dealer_visible['suit']}")
+        log("🃏 Dealer shows: %s of %s", dealer_visible['rank'], dealer_visible['suit'])
         log("🃏 Dealer's second card is hidden")
         
         # Player cards
         st.session_state.player_cards.append(player1)
         st.session_state.player_cards.append(player2)
         st.session_state.player_sum = player1["value"] + player2["value"]
-        log(f"🎴 Your card: {player1['rank']} of {player1['suit']}")
-        log(f"🎴 Your card: {player2['rank']} of {player2['suit']}")
-        log(f"📊 Your total: {st.session_state.player_sum}")
+        log("🎴 Your card: %s of %s", player1['rank'], player1['suit'])
+        log("🎴 Your card: %s of %s", player2['rank'], player2['suit'])
+        log("📊 Your total: %s", st.session_state.player_sum)
         
         # Check for initial bust (server sends result after cards)
         initial_result = sm.check_initial_bust()
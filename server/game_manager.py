@@ -1,11 +1,35 @@
 import random
 import time
+from types import MappingProxyType
+
+import numpy as np
 
 from shared.card import Card
 from shared.packets import TCP
-from storage.wrapper import TinyDBWrapper
+from storage.wrapper import get_db
+
+# Size of the per-round response time buffer, one slot per client decision. Every card is worth
+# at least 2, so the two opening cards sum to 4 or more and the hand busts by its 9th hit: a round
+# never records more than 9 decisions (9 hits, or up to 8 hits and a stand). 22 leaves generous
+# headroom above that bound, so add_client_response_time never runs past the buffer.
+MAX_DECISIONS_PER_ROUND = 22
 
 class ServerGameManager:
+    # Fixed attribute layout: no per-instance __dict__, and the per-card sum/bust updates
+    # read and write slot descriptors instead of dictionary entries.
+    __slots__ = (
+        "team_name", "number_of_rounds", "current_round",
+        "game_stats",
+        "client_game_cards", "server_game_cards",
+        "client_round_busts", "server_round_busts",
+        "client_response_time_in_round", "client_response_time_count", "client_response_time_in_game",
+        "total_game_time",
+        "deck", "deck_index",
+        "current_round_client_sum", "current_round_server_sum",
+        "client_cards", "server_cards",
+        "current_round_client_cards", "current_round_server_cards",
+    )
+
     # Input: number_of_rounds (int), team_name (str)
     # Output: initializes game manager instance
     # Description: Manages game state, statistics, and timing for a single client.
@@ -14,11 +38,8 @@ class ServerGameManager:
         self.number_of_rounds = number_of_rounds
         self.current_round = 0
 
-        self.game_stats = {
-            TCP.GAME_CLIENT_WIN_RESULT: 0,
-            TCP.GAME_SERVER_WIN_RESULT: 0,
-            TCP.GAME_TIE_RESULT: 0
-        }
+        # Indexed directly by the result constants (0..3), slot GAME_ROUND_NOT_OVER stays unused
+        self.game_stats = [0] * (TCP.GAME_CLIENT_WIN_RESULT + 1)
 
         self.client_game_cards = []
         self.server_game_cards = []
@@ -26,10 +47,16 @@ class ServerGameManager:
         self.client_round_busts = []
         self.server_round_busts = []
 
-        self.client_response_time_in_round = []
+        # Allocated once per game and reused every round; each round keeps a copy of its filled part
+        self.client_response_time_in_round = np.empty(MAX_DECISIONS_PER_ROUND, dtype=np.float64)
+        self.client_response_time_count = 0
         self.client_response_time_in_game = []
 
         self.total_game_time = None
+
+        # Cards are never mutated, so one deck is built per game and re-dealt every round
+        self.deck = self.create_deck()
+        self.deck_index = 0
         
     # Input: none
     # Output: list of Card objects
@@ -37,24 +64,23 @@ class ServerGameManager:
     def create_deck(self):
         return Card.create_deck()
     
-    # Input: none
-    # Output: none
-    # Description: Randomly shuffles the current deck.
-    def shuffle_deck(self):
-        random.shuffle(self.deck)
-
     # Input: none
     # Output: Card object
-    # Description: Removes and returns the top card from the deck.
+    # Description: Deals a uniformly random card from the cards not yet dealt this round (one Fisher–Yates step).
     def pop_card(self):
-        return self.deck.pop()
+        deck = self.deck
+        index = self.deck_index
+        swap_index = random.randrange(index, len(deck))
+        deck[index], deck[swap_index] = deck[swap_index], deck[index]
+        self.deck_index = index + 1
+        return deck[index]
     
     # Input: none
     # Output: none
     # Description: Initializes all values for a new round and deals starting cards.
     def init_round(self):
-        self.deck = self.create_deck()
-        self.shuffle_deck()
+        # Only the cards actually dealt get shuffled into place, no full-deck shuffle per round
+        self.deck_index = 0
 
         self.current_round_client_sum = 0
         self.current_round_server_sum = 0
@@ -73,7 +99,7 @@ class ServerGameManager:
         self.current_round_client_sum = client_card_1.value + client_card_2.value
         self.current_round_server_sum = server_card_1.value + server_card_2.value
 
-        self.client_response_time_in_round = []
+        self.client_response_time_count = 0
 
     # Input: card (Card)
     # Output: none
@@ -89,11 +115,28 @@ class ServerGameManager:
         self.server_cards.append(card)
         self.current_round_server_sum += card.value
 
+    # Input: none
+    # Output: Card object
+    # Description: Deals the next card into the client hand.
+    def draw_client_card(self):
+        card = self.pop_card()
+        self.add_client_card(card)
+        return card
+
+    # Input: none
+    # Output: Card object
+    # Description: Deals the next card into the dealer hand.
+    def draw_server_card(self):
+        card = self.pop_card()
+        self.add_server_card(card)
+        return card
+
     # Input: response_time (float)
     # Output: none
     # Description: Records client response time for the current round.
     def add_client_response_time(self, response_time):
-        self.client_response_time_in_round.append(response_time)
+        self.client_response_time_in_round[self.client_response_time_count] = response_time
+        self.client_response_time_count += 1
 
     # Input: none
     # Output: none
@@ -147,13 +190,11 @@ class ServerGameManager:
     # Description: Updates overall game statistics after a round ends.
     def update_game_stats(self, result):
         self.game_stats[result] += 1
-        self.client_game_cards.append(
-            [card.to_dict() for card in self.current_round_client_cards]
-        )
-        self.server_game_cards.append(
-            [card.to_dict() for card in self.current_round_server_cards]
-        )
-        self.client_response_time_in_game.append(self.client_response_time_in_round)
+        # Hands are kept as Card lists (a fresh list every round) and serialized once in to_dict
+        self.client_game_cards.append(self.current_round_client_cards)
+        self.server_game_cards.append(self.current_round_server_cards)
+        # tolist() copies out of the shared buffer before the next round overwrites it
+        self.client_response_time_in_game.append(self.client_response_time_in_round[:self.client_response_time_count].tolist())
 
     # Input: none
     # Output: dict
@@ -162,9 +203,13 @@ class ServerGameManager:
         return {
             "team_name": self.team_name,
             "number_of_rounds": self.number_of_rounds,
-            "game_stats": self.game_stats,
-            "client_game_cards": self.client_game_cards,
-            "server_game_cards": self.server_game_cards,
+            "game_stats": {
+                TCP.GAME_CLIENT_WIN_RESULT: self.game_stats[TCP.GAME_CLIENT_WIN_RESULT],
+                TCP.GAME_SERVER_WIN_RESULT: self.game_stats[TCP.GAME_SERVER_WIN_RESULT],
+                TCP.GAME_TIE_RESULT: self.game_stats[TCP.GAME_TIE_RESULT]
+            },
+            "client_game_cards": [[card.to_dict() for card in hand] for hand in self.client_game_cards],
+            "server_game_cards": [[card.to_dict() for card in hand] for hand in self.server_game_cards],
             "client_round_busts": self.client_round_busts,
             "server_round_busts": self.server_round_busts,
             "client_response_time_in_game": self.client_response_time_in_game,
@@ -173,11 +218,9 @@ class ServerGameManager:
     
     # Input: none
     # Output: none
-    # Description: Saves game results to the database.
+    # Description: Queues the game results to be saved to the database in the background.
     def save_to_db(self):
-        db = TinyDBWrapper()
-        db.insert(self.to_dict())
-        db.flush()
+        get_db().insert_async(self.to_dict())
 
     # Input: other (ServerGameManager)
     # Output: bool
@@ -189,14 +232,15 @@ class ServerGameManager:
         )
 
 
+# Read-only lookup from round result constant to its display string, built once at import.
+_RESULT_MAP = MappingProxyType({
+    TCP.GAME_TIE_RESULT: "TIE!",
+    TCP.GAME_SERVER_WIN_RESULT: "SERVER WINS!",
+    TCP.GAME_CLIENT_WIN_RESULT: "CLIENT WINS!"
+})
+
 # Input: result (int)
 # Output: string
 # Description: Converts a round result constant to a readable string.
-@staticmethod
 def get_result_as_string(result):
-    result_map = {
-        TCP.GAME_TIE_RESULT: "TIE!",
-        TCP.GAME_SERVER_WIN_RESULT: "SERVER WINS!",
-        TCP.GAME_CLIENT_WIN_RESULT: "CLIENT WINS!"
-    }
-    return result_map[result]
+    return _RESULT_MAP[result]
\ No newline at end of file
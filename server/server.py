@@ -1,13 +1,21 @@
+import functools
 import socket
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from shared.card import Card
 from shared.packets import TCP, UDP, get_local_ip
 from shared.logger import get_logger
 from server.game_manager import ServerGameManager, get_result_as_string
 
+# Result and validation messages never change - pack them once instead of on every turn.
+# ROUND_RESULT_MESSAGES is indexed by the round result constant.
+ROUND_RESULT_MESSAGES = tuple(TCP.create_payload_round_result(result) for result in range(TCP.GAME_CLIENT_WIN_RESULT + 1))
+VALIDATION_VALID_MESSAGE = TCP.create_payload_validation(TCP.PAYLOAD_VALID)
+VALIDATION_NOT_VALID_MESSAGE = TCP.create_payload_validation(TCP.PAYLOAD_NOT_VALID)
+
 class Server:
     # Input: none
     # Output: initializes server instance
@@ -19,99 +27,154 @@ class Server:
 
         self.SERVER_UDP_BROADCAST_PORT = 13122
         self.SERVER_BROADCAST_INTERVAL = 1
+        self.SERVER_SOCKET_BUFFER_SIZE = 256 * 1024
+
+        # A client whose host stops answering keepalive probes is dropped; players may think as long as they like
+        self.SERVER_KEEPALIVE_IDLE = 30
+        self.SERVER_KEEPALIVE_INTERVAL = 5
+        self.SERVER_KEEPALIVE_COUNT = 3
 
         self.active_games_map = {}
 
-        self.server_logger = get_logger()
+        # Client games run on a fixed pool of reused threads; connections beyond the limit wait for a free worker
+        self.SERVER_MAX_CLIENTS = 64
+        self.client_pool = ThreadPoolExecutor(max_workers=self.SERVER_MAX_CLIENTS, thread_name_prefix="bj-client")
+        self.client_sockets = set()
+
+        # Logging from many client threads - have a listener thread do the writing
+        self.server_logger = get_logger(background=True)
 
     # Input: none
     # Output: continuously sends UDP broadcast messages
     # Description: Periodically broadcasts server availability to clients via UDP.
     def broadcast_offers(self):
         server_udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        server_udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server_udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        server_udp_socket.bind((self.SERVER_HOST, self.SERVER_UDP_BROADCAST_PORT))
+        server_udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SERVER_SOCKET_BUFFER_SIZE)
+        # Send-only socket: ephemeral port, source IP pinned to the server's address (the routing table still picks the egress interface)
+        server_udp_socket.bind((self.SERVER_HOST, 0))
 
         self.server_logger.info("UDP Offer Server started. Broadcasting offers...")
 
         offer_message = UDP.create_offer_message(self.SERVER_TCP_PORT, self.SERVER_NAME)
+        broadcast_addr = ('<broadcast>', self.SERVER_UDP_BROADCAST_PORT)
+        interval = self.SERVER_BROADCAST_INTERVAL
+        # Sleep until absolute deadlines so the send time does not add up into drift
+        next_broadcast = time.monotonic()
         while True:
-            server_udp_socket.sendto(offer_message, ('<broadcast>', self.SERVER_UDP_BROADCAST_PORT))
-            time.sleep(self.SERVER_BROADCAST_INTERVAL)
+            server_udp_socket.sendto(offer_message, broadcast_addr)
+            next_broadcast += interval
+            time.sleep(max(0, next_broadcast - time.monotonic()))
 
     # Input: none
     # Output: accepts incoming TCP connections
-    # Description: Listens for TCP clients and spawns a thread per connection.
+    # Description: Listens for TCP clients and hands each connection to the client thread pool.
     def accept_client_connections(self):
         server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Set before listen() so the window scale is negotiated with them; accepted sockets inherit both sizes
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SERVER_SOCKET_BUFFER_SIZE)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SERVER_SOCKET_BUFFER_SIZE)
         server_socket.bind((self.SERVER_HOST, self.SERVER_TCP_PORT))
         server_socket.listen()  
 
-        self.server_logger.info(f"TCP server listening on port:{self.SERVER_TCP_PORT}")
+        self.server_logger.info("TCP server listening on port:%s", self.SERVER_TCP_PORT)
 
         while True:
             client_socket, client_addr = server_socket.accept()  
-            client_thread = threading.Thread(target=self.handle_client, args=(client_socket, client_addr), daemon=True)
-            client_thread.start()
+            # Every turn is a tiny request/response exchange - don't let Nagle hold the replies back
+            TCP.configure_socket(client_socket)
+            self.enable_keepalive(client_socket)
+            # Tracked from accept on, so connections still queued for a worker are closed on shutdown too
+            self.client_sockets.add(client_socket)
+            if len(self.client_sockets) > self.SERVER_MAX_CLIENTS:
+                self.server_logger.warning("All %s workers busy, %s waits for a free one", self.SERVER_MAX_CLIENTS, client_addr)
+            client_future = self.client_pool.submit(self.handle_client, client_socket, client_addr)
+            client_future.add_done_callback(functools.partial(self.close_cancelled_client, client_socket))
+
+    # Input: client socket, client future
+    # Output: none
+    # Description: Closes the socket of a queued connection whose game was cancelled before a worker picked it up.
+    def close_cancelled_client(self, client_socket, client_future):
+        if client_future.cancelled():
+            self.client_sockets.discard(client_socket)
+            client_socket.close()
+
+    # Input: client socket
+    # Output: none
+    # Description: Turns on TCP keepalive with short probe timings so a vanished client is detected in about 45 seconds.
+    def enable_keepalive(self, client_socket):
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # The fine-grained timings are not exposed on every platform - keep the OS defaults there
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.SERVER_KEEPALIVE_IDLE)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.SERVER_KEEPALIVE_INTERVAL)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.SERVER_KEEPALIVE_COUNT)
 
     # Input: client socket, client address
     # Output: none
     # Description: Manages full lifecycle of a connected client and its game.
     def handle_client(self, client_socket, client_addr):
-        self.server_logger.info(f"Connected to: {client_addr}")
+        self.server_logger.info("Connected to: %s", client_addr)
+        # One receive buffer per connection, every incoming message is read into it
+        recv_buffer = bytearray(TCP.HEADER_SIZE + max(TCP.MSG_REQUEST_SIZE, TCP.MSG_PAYLOAD_RESPONSE_SIZE))
         try:
-            #client_socket.settimeout(10.0)
-            num_rounds , team_name_bytes = self.get_game_settings_from_client(client_socket, client_addr)
-            self.active_games_map[client_addr] = ServerGameManager(number_of_rounds=num_rounds, team_name=team_name_bytes)
-            self.handle_client_game(client_socket, client_addr, self.active_games_map[client_addr])
+            num_rounds , team_name_bytes = self.get_game_settings_from_client(client_socket, client_addr, recv_buffer)
+            server_game_manager = ServerGameManager(number_of_rounds=num_rounds, team_name=team_name_bytes)
+            self.active_games_map[client_addr] = server_game_manager
+            self.handle_client_game(client_socket, client_addr, server_game_manager, recv_buffer)
                                     
         except ConnectionResetError:
             pass
+        except TimeoutError:
+            # Raised by recv once the client's host stops answering keepalive probes
+            self.server_logger.warning("Client %s stopped answering keepalive probes", client_addr)
         except Exception as ex:
-            self.server_logger.error(f"Error at handling client {client_addr}: with {ex}")
+            self.server_logger.error("Error at handling client %s: with %s", client_addr, ex)
         finally:
+            self.client_sockets.discard(client_socket)
             client_socket.close()
-            if client_addr in self.active_games_map:
-                del self.active_games_map[client_addr]
-            self.server_logger.info(f"Disconnected client: {client_addr}")
+            # Single atomic dict operation, safe while other client threads update the map
+            self.active_games_map.pop(client_addr, None)
+            self.server_logger.info("Disconnected client: %s", client_addr)
 
-    # Input: client socket, client address
+    # Input: client socket, client address, receive buffer
     # Output: (num_rounds, team_name)
     # Description: Receives and validates initial game request from client.
-    def get_game_settings_from_client(self, client_socket, client_addr):
+    def get_game_settings_from_client(self, client_socket, client_addr, recv_buffer):
         while True:
-            client_data = TCP.receive_response(client_socket, TCP.MSG_REQUEST_SIZE, TCP.MSG_TYPE_REQUEST)
-            self.server_logger.info(f"Received game request from {client_addr}")
-            num_rounds, team_name = client_data[0], client_data[1:].rstrip(b'\x00').decode('utf-8')
-            if (not str(num_rounds).isdigit() or num_rounds < 1):
-                self.server_logger.warning(f"Invalid number of rounds received from {client_addr}: {num_rounds}")
-                client_socket.sendall(TCP.create_payload_validation(TCP.PAYLOAD_NOT_VALID))
+            client_data = TCP.receive_response_into(client_socket, recv_buffer, TCP.MSG_REQUEST_SIZE, TCP.MSG_TYPE_REQUEST, client_addr)
+            self.server_logger.info("Received game request from %s", client_addr)
+            num_rounds, team_name = client_data[0], bytes(client_data[1:]).rstrip(b'\x00').decode('utf-8')
+            if (num_rounds < 1):
+                self.server_logger.warning("Invalid number of rounds received from %s: %s", client_addr, num_rounds)
+                client_socket.sendall(VALIDATION_NOT_VALID_MESSAGE)
                 continue
             else:
-                client_socket.sendall(TCP.create_payload_validation(TCP.PAYLOAD_VALID))
+                client_socket.sendall(VALIDATION_VALID_MESSAGE)
                 return num_rounds, team_name
 
-    # Input: client socket, client address, game manager
+    # Input: client socket, client address, game manager, receive buffer
     # Output: none
     # Description: Runs all game rounds for a client and records results.
-    def handle_client_game(self, client_socket, client_addr, server_game_manager):
-        self.server_logger.info(f"{client_addr} --- Game started for team: {server_game_manager.team_name} with {server_game_manager.number_of_rounds} rounds ---")
+    def handle_client_game(self, client_socket, client_addr, server_game_manager, recv_buffer):
+        self.server_logger.info("%s --- Game started for team: %s with %s rounds ---", client_addr, server_game_manager.team_name, server_game_manager.number_of_rounds)
         server_game_manager.start_timer()
         for i in range(server_game_manager.number_of_rounds):
-            self.server_logger.info(f"{client_addr} --- Starting new round {i + 1} of {server_game_manager.number_of_rounds} ---")
+            self.server_logger.info("%s --- Starting new round %s of %s ---", client_addr, i + 1, server_game_manager.number_of_rounds)
 
             self.init_client_game(client_socket, client_addr, server_game_manager)
 
-            round_result = self.handle_client_game_turn(client_socket, client_addr, server_game_manager)
-            self.server_logger.info(f"{client_addr} - Client final card score is - {server_game_manager.current_round_client_sum}")
+            round_result = self.handle_client_game_turn(client_socket, client_addr, server_game_manager, recv_buffer)
+            self.server_logger.info("%s - Client final card score is - %s", client_addr, server_game_manager.current_round_client_sum)
             if (round_result == TCP.GAME_ROUND_NOT_OVER):
                 round_result = self.handle_server_game_turn(client_socket, client_addr, server_game_manager)
             
             server_game_manager.current_round += 1
             server_game_manager.update_game_stats(round_result)
-            self.server_logger.info(f"{client_addr} --- Round {i + 1} complete ---\n")
+            self.server_logger.info("%s --- Round %s complete ---\n", client_addr, i + 1)
         
         server_game_manager.stop_timer()
         server_game_manager.save_to_db()
@@ -121,99 +184,116 @@ class Server:
     # Description: Initializes a new round and sends initial cards to client.
     def init_client_game(self, client_socket, client_addr, server_game_manager):
         server_game_manager.init_round()
-        self.server_logger.info(f"{client_addr} - Dealer card (visible): {server_game_manager.current_round_server_cards[0]}")
-        self.server_logger.info(f"{client_addr} - Dealer card (hidden): {server_game_manager.current_round_server_cards[1]}")
-        self.server_logger.info(f"{client_addr} - Client card #1: {server_game_manager.current_round_client_cards[0]}")
-        self.server_logger.info(f"{client_addr} - Client card #2: {server_game_manager.current_round_client_cards[1]}") 
+        self.server_logger.info("%s - Dealer card (visible): %s", client_addr, server_game_manager.current_round_server_cards[0])
+        self.server_logger.info("%s - Dealer card (hidden): %s", client_addr, server_game_manager.current_round_server_cards[1])
+        self.server_logger.info("%s - Client card #1: %s", client_addr, server_game_manager.current_round_client_cards[0])
+        self.server_logger.info("%s - Client card #2: %s", client_addr, server_game_manager.current_round_client_cards[1]) 
 
-        for card in server_game_manager.current_round_server_cards + server_game_manager.current_round_client_cards:
-            client_socket.sendall(TCP.create_payload_card(card))
+        # All four opening cards go out in a single frame
+        client_socket.sendall(TCP.create_payload_init_deal(
+            *server_game_manager.current_round_server_cards, *server_game_manager.current_round_client_cards
+        ))
 
-    # Input: client socket, client address, game manager
+    # Input: client socket, client address, game manager, receive buffer
     # Output: round result constant
     # Description: Handles the client’s turn including hit/stand decisions.
-    def handle_client_game_turn(self, client_socket, client_addr, server_game_manager):
+    def handle_client_game_turn(self, client_socket, client_addr, server_game_manager, recv_buffer):
         if (server_game_manager.is_client_busted()):
-            self.server_logger.info(f"{client_addr} - Client busted")
-            client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_SERVER_WIN_RESULT))
+            self.server_logger.info("%s - Client busted", client_addr)
+            client_socket.sendall(ROUND_RESULT_MESSAGES[TCP.GAME_SERVER_WIN_RESULT])
             return TCP.GAME_SERVER_WIN_RESULT
         else:
-            self.server_logger.info(f"{client_addr} --- Starting player turn ---")
-            client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_ROUND_NOT_OVER))
+            self.server_logger.info("%s --- Starting player turn ---", client_addr)
+            client_socket.sendall(ROUND_RESULT_MESSAGES[TCP.GAME_ROUND_NOT_OVER])
+        # Monotonic, high-resolution clock for the decision timings (bound once for the loop)
+        perf_counter = time.perf_counter
         while True:
-            decision_time_start = time.time()
-            client_decision = self.get_client_decision(client_socket, client_addr)
-            decision_time_end = time.time()
-            server_game_manager.add_client_response_time(response_time=decision_time_end - decision_time_start)
-            self.server_logger.info(f"{client_addr} - Client decision: {client_decision}")
+            decision_time_start = perf_counter()
+            client_decision = self.get_client_decision(client_socket, client_addr, recv_buffer)
+            server_game_manager.add_client_response_time(perf_counter() - decision_time_start)
+            self.server_logger.info("%s - Client decision: %s", client_addr, client_decision)
             if (client_decision == "hittt"):
-                new_card = server_game_manager.pop_card()
-                server_game_manager.add_client_card(new_card)
-                self.server_logger.info(f"{client_addr} - Dealt new card to client: rank={new_card.rank} suit={new_card.suit}")
-                client_socket.sendall(TCP.create_payload_card(new_card))
+                new_card = server_game_manager.draw_client_card()
+                self.server_logger.info("%s - Dealt new card to client: rank=%s suit=%s", client_addr, new_card.rank, new_card.suit)
+                # The new card and the round result are sent together in one write
+                card_message = TCP.create_payload_card(new_card)
 
-                self.server_logger.info(f"{client_addr} - Client current sum: {server_game_manager.current_round_client_sum}")
+                self.server_logger.info("%s - Client current sum: %s", client_addr, server_game_manager.current_round_client_sum)
                 if (server_game_manager.current_round_client_sum > 21):
-                    self.server_logger.info(f"{client_addr} - Client busted")
+                    self.server_logger.info("%s - Client busted", client_addr)
                     server_game_manager.add_client_bust()
-                    client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_SERVER_WIN_RESULT))
+                    client_socket.sendall(card_message + ROUND_RESULT_MESSAGES[TCP.GAME_SERVER_WIN_RESULT])
                     return TCP.GAME_SERVER_WIN_RESULT
                 else:
-                    client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_ROUND_NOT_OVER))
+                    client_socket.sendall(card_message + ROUND_RESULT_MESSAGES[TCP.GAME_ROUND_NOT_OVER])
                     
             elif (client_decision == "stand"):
                 return TCP.GAME_ROUND_NOT_OVER
             
-    # Input: client socket, client address
+    # Input: client socket, client address, receive buffer
     # Output: "hittt" or "stand"
     # Description: Receives and validates a single player decision from client.
-    def get_client_decision(self, client_socket, client_addr):
+    def get_client_decision(self, client_socket, client_addr, recv_buffer):
         while True:
-            client_data = TCP.receive_response(client_socket, TCP.MSG_PAYLOAD_RESPONSE_SIZE, TCP.MSG_TYPE_PAYLOAD)
-            decision = client_data.decode("utf-8", errors="ignore").strip('\x00').lower()
-            if (decision not in ('hittt','stand')):
-                    self.server_logger.warning(f"Invalid client decision from {client_addr}: {decision}")
-                    client_socket.sendall(TCP.create_payload_validation(TCP.PAYLOAD_NOT_VALID))
+            client_data = TCP.receive_response_into(client_socket, recv_buffer, TCP.MSG_PAYLOAD_RESPONSE_SIZE, TCP.MSG_TYPE_PAYLOAD, client_addr)
+            # Both clients send exactly "Hittt" / "Stand" - compare the buffer view without copying it
+            if (client_data == b'Hittt'):
+                return "hittt"
+            elif (client_data == b'Stand'):
+                return "stand"
+
+            # Anything else is normalized before validation; only an invalid decision is decoded (for the warning)
+            decision = client_data.tobytes().rstrip(b'\x00').lower()
+            if (decision == b'hittt'):
+                return "hittt"
+            elif (decision == b'stand'):
+                return "stand"
             else:
-                return decision
+                self.server_logger.warning("Invalid client decision from %s: %s", client_addr, decision.decode('utf-8', errors='ignore'))
+                client_socket.sendall(VALIDATION_NOT_VALID_MESSAGE)
             
     # Input: client socket, client address, game manager
     # Output: round result constant
     # Description: Executes dealer logic according to Blackjack rules.
     def handle_server_game_turn(self, client_socket, client_addr, server_game_manager):
-        self.server_logger.info(f"{client_addr} --- Starting dealer turn ---")
+        self.server_logger.info("%s --- Starting dealer turn ---", client_addr)
         dealer_revealed_card = server_game_manager.current_round_server_cards[0]
         dealer_hidden_card = server_game_manager.current_round_server_cards[1]
-        self.server_logger.info(f"{client_addr} - Dealer's revealed card: rank={dealer_revealed_card.rank} suit={dealer_revealed_card.suit}")
-        self.server_logger.info(f"{client_addr} - Revealing dealer's hidden card: rank={dealer_hidden_card.rank} suit={dealer_hidden_card.suit}")
-        client_socket.sendall(TCP.create_payload_card(dealer_hidden_card))
+        self.server_logger.info("%s - Dealer's revealed card: rank=%s suit=%s", client_addr, dealer_revealed_card.rank, dealer_revealed_card.suit)
+        self.server_logger.info("%s - Revealing dealer's hidden card: rank=%s suit=%s", client_addr, dealer_hidden_card.rank, dealer_hidden_card.suit)
+        # The dealer never waits on the client, so the whole turn (hidden card, every draw and the
+        # final result) is played out first and sent in one write. The frames are the same as before.
+        messages = [TCP.create_payload_card(dealer_hidden_card)]
         while True:
             if (server_game_manager.current_round_server_sum > 21):
-                self.server_logger.info(f"{client_addr} - Dealer busted with sum {server_game_manager.current_round_server_sum}")
+                self.server_logger.info("%s - Dealer busted with sum %s", client_addr, server_game_manager.current_round_server_sum)
                 server_game_manager.add_server_bust()
-                client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_CLIENT_WIN_RESULT))
-                return TCP.GAME_CLIENT_WIN_RESULT
+                round_result = TCP.GAME_CLIENT_WIN_RESULT
+                break
             elif (server_game_manager.current_round_server_sum >= 17):
-                self.server_logger.info(f"{client_addr} - Dealer choses to stand")
-                return self.calculate_final_game_result(client_socket, client_addr, server_game_manager)
+                self.server_logger.info("%s - Dealer choses to stand", client_addr)
+                round_result = self.calculate_final_game_result(client_addr, server_game_manager)
+                break
             else:               
-                self.server_logger.info(f"{client_addr} - Dealer choses to draw another card.")
-                client_socket.sendall(TCP.create_payload_round_result(TCP.GAME_ROUND_NOT_OVER))
-                new_card = server_game_manager.pop_card()
-                server_game_manager.add_server_card(new_card)
-                self.server_logger.info(f"{client_addr} - Dealer drew card: rank={new_card.rank} suit={new_card.suit}")
-                self.server_logger.info(f"{client_addr} - Dealer current sum: {server_game_manager.current_round_server_sum}")
-                client_socket.sendall(TCP.create_payload_card(new_card))
+                self.server_logger.info("%s - Dealer choses to draw another card.", client_addr)
+                new_card = server_game_manager.draw_server_card()
+                self.server_logger.info("%s - Dealer drew card: rank=%s suit=%s", client_addr, new_card.rank, new_card.suit)
+                self.server_logger.info("%s - Dealer current sum: %s", client_addr, server_game_manager.current_round_server_sum)
+                messages.append(ROUND_RESULT_MESSAGES[TCP.GAME_ROUND_NOT_OVER])
+                messages.append(TCP.create_payload_card(new_card))
 
+        messages.append(ROUND_RESULT_MESSAGES[round_result])
+        client_socket.sendall(b"".join(messages))
+        return round_result
 
-    # Input: client socket, client address, game manager
+
+    # Input: client address, game manager
     # Output: final round result
-    # Description: Compares dealer and player scores and sends result.
-    def calculate_final_game_result(self, client_socket, client_addr, server_game_manager):
-        self.server_logger.info(f"{client_addr} --- Round ended. Calculating result... ---")
+    # Description: Compares dealer and player scores (the caller sends the result).
+    def calculate_final_game_result(self, client_addr, server_game_manager):
+        self.server_logger.info("%s --- Round ended. Calculating result... ---", client_addr)
         round_result = server_game_manager.get_round_result()
-        self.server_logger.info(f"{client_addr} --- Final Result is: {get_result_as_string(round_result)} ---")
-        client_socket.sendall(TCP.create_payload_round_result(round_result))
+        self.server_logger.info("%s --- Final Result is: %s ---", client_addr, get_result_as_string(round_result))
         return round_result
 
     # Input: none
@@ -226,8 +306,24 @@ class Server:
         accept_thread = threading.Thread(target=self.accept_client_connections, daemon=True)
         accept_thread.start()
 
-        broadcast_thread.join()
-        accept_thread.join()
+        try:
+            broadcast_thread.join()
+            accept_thread.join()
+        finally:
+            self.close()
+
+    # Input: none
+    # Output: none
+    # Description: Stops the client thread pool and disconnects the clients still playing or waiting.
+    def close(self):
+        # Cancelling the queued games closes their sockets through close_cancelled_client
+        self.client_pool.shutdown(wait=False, cancel_futures=True)
+        # Pool workers are not daemon threads - unblock their recv calls so the process can exit
+        for client_socket in list(self.client_sockets):
+            try:
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
 # Input: none
 # Output: none
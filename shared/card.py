@@ -1,50 +1,80 @@
+from types import MappingProxyType
+
+
 class Card:
+    # Only the 52 shared CARDS instances exist, so keep each one small (no per-instance __dict__)
+    __slots__ = ("suit", "rank", "value", "_emoji")
+
     ranks = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
     suits = ('H', 'D', 'C', 'S')
 
-    rank_to_idx = {r: i for i, r in enumerate(ranks)}
-    suit_to_idx = {s: i for i, s in enumerate(suits)}
+    # The lookup tables are shared by every card and never change - expose them read-only
+    rank_to_idx = MappingProxyType({r: i for i, r in enumerate(ranks)})
+    suit_to_idx = MappingProxyType({s: i for i, s in enumerate(suits)})
     values = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+    rank_to_value = MappingProxyType(dict(zip(ranks, values)))
 
-    suits_emoji = {'H': '♥️', 'D': '♦️', 'C': '♣️', 'S': '♠️'}
-    rank_emoji = {
+    suits_emoji = MappingProxyType({'H': '♥️', 'D': '♦️', 'C': '♣️', 'S': '♠️'})
+    rank_emoji = MappingProxyType({
         '2': '2️⃣', '3': '3️⃣', '4': '4️⃣', '5': '5️⃣', '6': '6️⃣',
         '7': '7️⃣', '8': '8️⃣', '9': '9️⃣', '10': '🔟',
         'J': '🃏(J)', 'Q': '👸(Q)', 'K': '👑(K)', 'A': '🅰️'
-    }
+    })
 
     # Input: suit (str), rank (str)
     # Output: Card object
     # Description: Creates a card with suit, rank, and numerical value.
+    #              Slow path (string lookups) - used to build CARDS; everything else should reuse those via from_index.
     def __init__(self, suit, rank):
         self.suit = suit
         self.rank = rank
-        self.value = Card.values[Card.rank_to_idx[rank]]
+        self.value = Card.rank_to_value[rank]
+        # Rendered once per card - every card is a shared CARDS instance, so this is 52 strings in total
+        self._emoji = f"rank={Card.rank_emoji[rank]} , suit={Card.suits_emoji[suit]}"
+
+    # Input: rank_idx (int), suit_idx (int)
+    # Output: Card object
+    # Description: Returns the shared card for the given rank and suit indices with a single table lookup.
+    #              Raises ValueError for a rank index past the last rank - in the flat table it would silently
+    #              land on a card of the next suit.
+    @classmethod
+    def from_index(cls, rank_idx, suit_idx):
+        if rank_idx >= len(cls.ranks):
+            raise ValueError(f"invalid card rank index: {rank_idx}")
+        return CARDS[suit_idx * 13 + rank_idx]
 
     # Input: none
     # Output: list of Card objects
-    # Description: Generates a standard 52-card deck.
+    # Description: Generates a standard 52-card deck (a new list over the shared CARDS objects).
     @staticmethod
     def create_deck():
-        return [Card(suit, rank) for suit in Card.suits for rank in Card.ranks]
+        return list(CARDS)
 
     # Input: none
-    # Output: bytes (2 bytes)
-    # Description: Encodes card rank and suit into a compact byte format.
+    # Output: bytes (1 byte)
+    # Description: Encodes card rank and suit into a single byte: rank index in the high bits, suit index in the low 2 bits.
     def encode_to_bytes(self):
         rank_idx = Card.rank_to_idx[self.rank]   # 0..12
         suit_idx = Card.suit_to_idx[self.suit]   # 0..3
-        return bytes([rank_idx, suit_idx])
+        return bytes([(rank_idx << 2) | suit_idx])
 
     # Input: byte_data (bytes)
     # Output: Card object
     # Description: Decodes a card from its byte representation.
     @staticmethod
     def decode_from_bytes(byte_data):
-        rank_idx = byte_data[0]
-        suit_idx = byte_data[1]
-        return Card(Card.suits[suit_idx], Card.ranks[rank_idx])
+        packed = byte_data[0]
+        return Card.from_index(packed >> 2, packed & 0x3)
     
+    # Input: byte_data (bytes)
+    # Output: dict with rank, suit and value
+    # Description: Decodes a card straight into the dictionary form the UI works with.
+    @staticmethod
+    def decode_dict(byte_data):
+        packed = byte_data[0]
+        rank_idx = packed >> 2
+        return {"rank": Card.ranks[rank_idx], "suit": Card.suits[packed & 0x3], "value": Card.values[rank_idx]}
+
     # Input: none
     # Output: dict
     # Description: Converts the card to a dictionary representation.
@@ -61,4 +91,9 @@ class Card:
     # Output: string
     # Description: Returns a human-friendly emoji representation of the card.
     def emoji_str(self):
-        return f"rank={Card.rank_emoji[self.rank]} , suit={Card.suits_emoji[self.suit]}"
+        return self._emoji
+
+
+# Every possible card, built once at import and shared process-wide (cards are never mutated).
+# Ordered suit-major, so the card for (suit_idx, rank_idx) sits at suit_idx * 13 + rank_idx.
+CARDS = tuple(Card(suit, rank) for suit in Card.suits for rank in Card.ranks)
@@ -1,4 +1,8 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from typing import Optional
 from colorama import init
 
 # Input: none
@@ -20,10 +24,11 @@ def _input(self, msg, *args, **kwargs):
 logging.Logger.input = _input
 
 
-class ColoredFormatter(logging.Formatter):
+class ColorFilter(logging.Filter):
     # Input: none
-    # Output: formatted log string
-    # Description: Formatter that adds color to log level names and messages.
+    # Output: True (never drops records)
+    # Description: Handler filter that tags each record with its level's ANSI color codes,
+    #              so a plain logging.Formatter can color the output from its format string.
     COLORS = {
         "DEBUG": "\033[36m",    # Cyan
         "INFO": "\033[32m",     # Green
@@ -34,27 +39,17 @@ class ColoredFormatter(logging.Formatter):
     RESET = "\033[0m"
 
     # Input: record (logging.LogRecord)
-    # Output: string
-    # Description: Formats log records with ANSI color codes.
-    def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
+    # Output: bool
+    # Description: Sets record.color_start / record.color_end (empty for levels without a color).
+    def filter(self, record: logging.LogRecord) -> bool:
+        color = self.COLORS.get(record.levelname, "")
+        record.color_start = color
+        record.color_end = self.RESET if color else ""
+        return True
 
-        orig_levelname = record.levelname
-        orig_msg = record.msg
-        orig_args = record.args
 
-        try:
-            record.levelname = f"{color}{orig_levelname}{self.RESET}"
-
-            message = record.getMessage()
-            record.msg = f"{color}{message}{self.RESET}"
-            record.args = ()  
-
-            return super().format(record)
-        finally:
-            record.levelname = orig_levelname
-            record.msg = orig_msg
-            record.args = orig_args
+# Colors come from the attributes ColorFilter puts on every record
+COLORED_FORMAT = "%(asctime)s [%(color_start)s%(levelname)s%(color_end)s] %(color_start)s%(message)s%(color_end)s"
 
 
 class InputAwareStreamHandler(logging.StreamHandler):
@@ -76,28 +71,45 @@ class InputAwareStreamHandler(logging.StreamHandler):
 
 
 _logger = None 
+_logger_background = False
 
 
-# Input: name (str), level (int)
+# Input: name (str), level (int), background (bool or None)
 # Output: logging.Logger
 # Description: Creates or returns a singleton colored logger instance.
-def get_logger(name: str = "app", level: int = logging.INFO) -> logging.Logger:
-    global _logger
+#              The first call creates the logger and fixes its mode - later calls get that same logger and their
+#              arguments are ignored (a conflicting explicit background is reported with a warning).
+#              Records are written synchronously by default, so interactive INPUT prompts come out in order.
+#              Long-running services pass background=True: records are handed to a queue and written by a
+#              listener thread, so callers only pay for an enqueue. background=None accepts whichever mode exists.
+def get_logger(name: str = "app", level: int = logging.INFO, background: Optional[bool] = None) -> logging.Logger:
+    global _logger, _logger_background
     if _logger is not None:
+        if background is not None and background != _logger_background:
+            _logger.warning("get_logger(background=%s) ignored - the logger was already created with background=%s", background, _logger_background)
         return _logger
 
+    background = bool(background)
     logger = logging.getLogger(name)
     logger.setLevel(level)
     logger.propagate = False  
 
     if not logger.handlers:
         handler = InputAwareStreamHandler()
-        handler.setFormatter(
-            ColoredFormatter("%(asctime)s [%(levelname)s] %(message)s")
-        )
-        logger.addHandler(handler)
+        handler.addFilter(ColorFilter())
+        handler.setFormatter(logging.Formatter(COLORED_FORMAT))
+        if background:
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, handler)
+            listener.start()
+            # Write out whatever is still queued before the interpreter exits
+            atexit.register(listener.stop)
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        else:
+            logger.addHandler(handler)
 
     _logger = logger
+    _logger_background = background
     return logger
 
 
@@ -105,7 +117,7 @@ def get_logger(name: str = "app", level: int = logging.INFO) -> logging.Logger:
 # Output: none
 # Description: Demo usage of the custom colored logger.
 if __name__ == "__main__":
-    log = get_logger(level=logging.DEBUG)
+    log = get_logger(level=logging.DEBUG, background=False)
 
     log.info("Starting...")
     log.input("Enter your name: ")  # stays on same line
@@ -1,3 +1,4 @@
+import functools
 import struct
 import socket
 
@@ -7,6 +8,8 @@ from shared.logger import get_logger
 # Input: none
 # Output: local IP address string
 # Description: Detects local IP by connecting a UDP socket to a public address.
+#              Cached after the first lookup; call get_local_ip.cache_clear() if the network changes.
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
     temp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
@@ -23,6 +26,12 @@ class UDP:
     SERVER_NAME_SIZE = 32
     PORT_SIZE = 0x02
 
+    # Precompiled layouts: the format strings are parsed once here, not on every pack/unpack
+    OFFER_HEADER_STRUCT = struct.Struct("!IBH")
+    OFFER_STRUCT = struct.Struct(f"!IBH{SERVER_NAME_SIZE}s")
+    # Magic cookie + offer type as they appear on the wire, for a cheap bytes-prefix check of incoming datagrams
+    OFFER_PREFIX = struct.pack("!IB", MAGIC_COOKIE, OFFER_MESSAGE_TYPE)
+
     @staticmethod
     # Input: socket (UDP socket)
     # Output: (server_addr, server_name_bytes)
@@ -33,15 +42,15 @@ class UDP:
     def receive_response(socket):
         while True:
             data, addr = socket.recvfrom(4 + 1 + UDP.PORT_SIZE + UDP.SERVER_NAME_SIZE)
-            if len(data) < 39:
+            # Stray datagrams are rejected by a plain bytes compare, only real offers get unpacked
+            if len(data) < UDP.OFFER_STRUCT.size or not data.startswith(UDP.OFFER_PREFIX):
                 continue
-            magic, msg_type, port, server_name = struct.unpack(f"!IBH{UDP.SERVER_NAME_SIZE}s", data[:39])
+            _, _, port, server_name = UDP.OFFER_STRUCT.unpack_from(data)
 
-            if magic == UDP.MAGIC_COOKIE and msg_type == UDP.OFFER_MESSAGE_TYPE:
-                server_ip = addr[0]
-                server_port = port
-                server_addr = (server_ip, server_port)
-                return server_addr, server_name
+            server_ip = addr[0]
+            server_port = port
+            server_addr = (server_ip, server_port)
+            return server_addr, server_name
 
     @staticmethod
     # Input: tcp_port (int), server_name (str)
@@ -50,16 +59,18 @@ class UDP:
     def create_offer_message(tcp_port, server_name):
         name_bytes = server_name.encode("utf-8", errors="ignore")
         name_bytes = name_bytes[:UDP.SERVER_NAME_SIZE].ljust(UDP.SERVER_NAME_SIZE, b"\x00")
-        return struct.pack(f"!IBH{UDP.SERVER_NAME_SIZE}s", UDP.MAGIC_COOKIE,UDP.OFFER_MESSAGE_TYPE, tcp_port, name_bytes)
+        return UDP.OFFER_STRUCT.pack(UDP.MAGIC_COOKIE, UDP.OFFER_MESSAGE_TYPE, tcp_port, name_bytes)
     
 class TCP:
     MAGIC_COOKIE = 0xabcddcba
+    HEADER_SIZE = 4 + 1
 
     MSG_TYPE_REQUEST = 0x03
     MSG_REQUEST_SIZE = 33
 
     MSG_TYPE_PAYLOAD = 0x04
-    MSG_PAYLOAD_CARD_SIZE = 3
+    # One byte per card: (rank_idx << 2) | suit_idx, see Card.encode_to_bytes
+    MSG_PAYLOAD_CARD_SIZE = 1
     MSG_PAYLOAD_RESPONSE_SIZE = 5
     MSG_PAYLOAD_RESULT_SIZE = 1
 
@@ -67,38 +78,81 @@ class TCP:
     PAYLOAD_VALID = 0x01
     PAYLOAD_NOT_VALID = 0x00
 
+    # Opening deal of a round in one frame: dealer visible, dealer hidden, client card 1, client card 2
+    MSG_TYPE_INIT_DEAL = 0x06
+    MSG_INIT_DEAL_SIZE = 4 * MSG_PAYLOAD_CARD_SIZE
+
     GAME_CLIENT_WIN_RESULT = 0x03
     GAME_SERVER_WIN_RESULT = 0x02
     GAME_TIE_RESULT = 0x01
     GAME_ROUND_NOT_OVER = 0x00
 
+    # Precompiled frame layouts: the format strings are parsed once here, not on every pack/unpack
+    HEADER_STRUCT = struct.Struct("!IB")
+    REQUEST_STRUCT = struct.Struct(f"!IBB{MSG_REQUEST_SIZE - 1}s")
+    CARD_STRUCT = struct.Struct(f"!IB{MSG_PAYLOAD_CARD_SIZE}s")
+    RESPONSE_STRUCT = struct.Struct(f"!IB{MSG_PAYLOAD_RESPONSE_SIZE}s")
+    BYTE_STRUCT = struct.Struct("!IBB")
+    INIT_DEAL_STRUCT = struct.Struct(f"!IB{MSG_INIT_DEAL_SIZE}s")
+
     @staticmethod
-    # Input: socket (UDP socket)
-    # Output: (server_addr, server_name_bytes)
-    # Description: Receives and validates a UDP offer message.
-    # Input: socket (TCP socket), payload_size (int), message_type (int)
+    # Input: sock (TCP socket)
+    # Output: none
+    # Description: Tunes a connected game socket for the tiny turn-by-turn messages: Nagle off.
+    def configure_socket(sock):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    @staticmethod
+    # Input: socket (TCP socket), buffer (bytearray), payload_size (int), message_type (int), peer (address for warnings)
+    # Output: memoryview of the payload inside buffer, or None
+    # Description: Receives one framed TCP message into a reusable buffer and validates magic cookie and type.
+    def receive_response_into(socket, buffer, payload_size, message_type, peer=None):
+        logger = get_logger()
+        frame_size = TCP.HEADER_SIZE + payload_size
+        view = memoryview(buffer)
+        while True:
+            received = 0
+            while received < frame_size:
+                count = socket.recv_into(view[received:frame_size])
+                if not count:
+                    return None
+                received += count
+
+            magic, type = TCP.HEADER_STRUCT.unpack_from(buffer)
+            if (magic != TCP.MAGIC_COOKIE or message_type != type):
+                logger.warning("Invalid magic cookie or message type from: %s", peer if peer is not None else socket.getpeername())
+                continue
+            return view[TCP.HEADER_SIZE:frame_size]
+
+    @staticmethod
+    # Input: reader (buffered socket file), payload_size (int), message_type (int)
     # Output: payload bytes or None
-    # Description: Receives one framed TCP message and validates magic cookie and type.
-    def receive_response(socket, payload_size, message_type):
+    # Description: Reads one framed TCP message from a buffered reader and validates it.
+    def read_response(reader, payload_size, message_type):
         logger = get_logger()
+        frame_size = TCP.HEADER_SIZE + payload_size
         while True:
-            data = socket.recv(4 + 1 + payload_size)
-            if not data:
+            data = reader.read(frame_size)
+            if len(data) < frame_size:
                 return None
-            
-            magic = struct.unpack("!I", data[:4])[0]
-            if (magic != TCP.MAGIC_COOKIE):
-                logger.warning("Invalid magic cookie from:", socket.getpeername())
-                continue
-            
-            type = struct.unpack("!B", data[4:5])[0]
-            if (message_type != type):
-                logger.warning("Invalid message type from:", socket.getpeername())
+
+            payload = TCP.parse_response(data, 0, payload_size, message_type)
+            if payload is None:
+                logger.warning("Invalid magic cookie or message type from server")
                 continue
-            
-            _, _ , payload = struct.unpack(f"!IB{payload_size}s", data[:4+1+payload_size])
             return payload
 
+    @staticmethod
+    # Input: data (bytes), offset (int), payload_size (int), message_type (int)
+    # Output: payload bytes or None
+    # Description: Parses one framed TCP message at offset and validates magic cookie and type.
+    def parse_response(data, offset, payload_size, message_type):
+        magic, type = TCP.HEADER_STRUCT.unpack_from(data, offset)
+        if (magic != TCP.MAGIC_COOKIE or message_type != type):
+            return None
+        start = offset + TCP.HEADER_SIZE
+        return data[start:start + payload_size]
+
     @staticmethod
     # Input: team_name (str), num_rounds (int)
     # Output: bytes request message
@@ -110,7 +164,7 @@ class TCP:
         name_bytes = team_name.encode("utf-8", errors="ignore")
         name_bytes = name_bytes[:(TCP.MSG_REQUEST_SIZE-1)].ljust((TCP.MSG_REQUEST_SIZE-1), b"\x00")
 
-        return struct.pack(f"!IBB{TCP.MSG_REQUEST_SIZE-1}s", TCP.MAGIC_COOKIE, TCP.MSG_TYPE_REQUEST, num_rounds, name_bytes)
+        return TCP.REQUEST_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_REQUEST, num_rounds, name_bytes)
     
     @staticmethod
     # Input: card (Card)
@@ -118,7 +172,15 @@ class TCP:
     # Description: Encodes a Card object as a TCP payload message.
     def create_payload_card(card):
         card_bytes = card.encode_to_bytes()
-        return struct.pack(f"!IB{TCP.MSG_PAYLOAD_CARD_SIZE}s", TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, card_bytes)
+        return TCP.CARD_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, card_bytes)
+    
+    @staticmethod
+    # Input: dealer_visible, dealer_hidden, client_card_1, client_card_2 (Card)
+    # Output: bytes init deal message
+    # Description: Encodes a round's four opening cards as a single TCP message.
+    def create_payload_init_deal(dealer_visible, dealer_hidden, client_card_1, client_card_2):
+        cards_bytes = b"".join(card.encode_to_bytes() for card in (dealer_visible, dealer_hidden, client_card_1, client_card_2))
+        return TCP.INIT_DEAL_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_INIT_DEAL, cards_bytes)
     
     @staticmethod
     # Input: response (str)
@@ -127,21 +189,21 @@ class TCP:
     def create_payload_response(response):
         response_bytes = response.encode("utf-8", errors="ignore")
         response_bytes = response_bytes[:TCP.MSG_PAYLOAD_RESPONSE_SIZE]
-        return struct.pack(f"!IB{TCP.MSG_PAYLOAD_RESPONSE_SIZE}s", TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, response_bytes)
+        return TCP.RESPONSE_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, response_bytes)
     
     @staticmethod
     # Input: result (int)
     # Output: bytes payload message
     # Description: Encodes the round result byte as a TCP payload message.
     def create_payload_round_result(result):
-        return struct.pack("!IBB", TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, result)
+        return TCP.BYTE_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_PAYLOAD, result)
     
     @staticmethod
     # Input: result (int)
     # Output: bytes validation message
     # Description: Encodes a validation byte (valid/invalid) as a TCP message.
     def create_payload_validation(result):
-        return struct.pack("!IBB", TCP.MAGIC_COOKIE, TCP.MSG_TYPE_VALIDATION, result)
+        return TCP.BYTE_STRUCT.pack(TCP.MAGIC_COOKIE, TCP.MSG_TYPE_VALIDATION, result)
     
     @staticmethod
     # Input: vr1 (bytes), vr2 (int)
@@ -149,3 +211,44 @@ class TCP:
     # Description: Checks whether the validation payload matches the expected value.
     def verify_validation_message(vr1, vr2):
         return vr2 == vr1[0]
+
+
+class TCPFramer:
+    RECV_SIZE = 4096
+
+    # Input: none
+    # Output: initializes framer instance
+    # Description: Per-connection receive buffer that splits a TCP byte stream into framed messages.
+    def __init__(self):
+        self.buffer = bytearray()
+
+    # Input: socket (TCP socket), payload_size (int), message_type (int), peer (address for warnings)
+    # Output: payload bytes or None on disconnect
+    # Description: Returns the next framed message's payload, receiving in RECV_SIZE chunks only when the buffer runs short.
+    def feed_and_parse(self, socket, payload_size, message_type, peer=None):
+        buffer = self.buffer
+        frame_size = TCP.HEADER_SIZE + payload_size
+        while True:
+            # Frames the peer sent back-to-back usually arrive together, so one recv() tends to serve several calls
+            while len(buffer) < frame_size:
+                chunk = socket.recv(TCPFramer.RECV_SIZE)
+                if not chunk:
+                    return None
+                buffer += chunk
+
+            magic, type = TCP.HEADER_STRUCT.unpack_from(buffer)
+            # Copy the payload straight out of the buffer (a plain slice would copy it twice); the view must be
+            # released before the bytearray can shrink
+            with memoryview(buffer) as view:
+                payload = bytes(view[TCP.HEADER_SIZE:frame_size])
+            del buffer[:frame_size]
+            if (magic != TCP.MAGIC_COOKIE or message_type != type):
+                get_logger().warning("Invalid magic cookie or message type from: %s", peer if peer is not None else socket.getpeername())
+                continue
+            return payload
+
+    # Input: none
+    # Output: none
+    # Description: Drops any buffered bytes (e.g. when the connection is replaced).
+    def reset(self):
+        self.buffer.clear()
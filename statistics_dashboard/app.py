@@ -3,28 +3,49 @@ Blackjack Statistics Dashboard
 Displays various graphs and statistics from game data
 """
 
+import itertools
+import mmap
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import streamlit as st
-import json
+import orjson
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from collections import Counter
 import numpy as np
 
+from statistics_dashboard.hand_kernels import reduce_hands
+
 # Card values for calculating hand totals
 CARD_VALUES = {
     '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
     '10': 10, 'J': 10, 'Q': 10, 'K': 10, 'A': 11
 }
 
+# Rank -> small integer id for the vectorized hand totals; unknown ranks map to the extra last id (value 0)
+RANK_IDS = {rank: i for i, rank in enumerate(CARD_VALUES)}
+UNKNOWN_RANK_ID = len(RANK_IDS)
+ACE_RANK_ID = RANK_IDS['A']
+RANK_VALUE_LUT = np.array(list(CARD_VALUES.values()) + [0], dtype=np.int64)
+
 SUIT_SYMBOLS = {'H': '♥️', 'D': '♦️', 'C': '♣️', 'S': '♠️'}
+# Suit -> id for the card counts, in SUIT_SYMBOLS order; unknown suits map to the extra last id
+SUIT_IDS = {suit: i for i, suit in enumerate(SUIT_SYMBOLS)}
+UNKNOWN_SUIT_ID = len(SUIT_IDS)
+
+DATA_FILE = "storage/data/db_mock.json"
 
-def load_data(file_path: str = "storage/data/db_mock.json") -> dict:
+def load_data(file_path: str = DATA_FILE) -> dict:
     """Load game data from JSON file"""
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # orjson parses straight out of the mapped file pages - no str decode or intermediate read buffer
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = orjson.loads(memoryview(mm))
         # Support both 'default' and 'games' keys
         return data.get("games", data.get("default", {}))
     except Exception as e:
@@ -32,55 +53,49 @@ def load_data(file_path: str = "storage/data/db_mock.json") -> dict:
         return {}
 
 
-def calculate_hand_value(cards: list) -> int:
-    """Calculate the value of a hand"""
-    total = 0
-    aces = 0
-    for card in cards:
-        rank = card.get('rank', '0')
-        if rank == 'A':
-            aces += 1
-            total += 11
-        else:
-            total += CARD_VALUES.get(rank, 0)
-    
-    # Adjust for aces
-    while total > 21 and aces > 0:
-        total -= 10
-        aces -= 1
-    
-    return total
+CARD_CODE_DTYPE = np.dtype([('rank', np.int8), ('suit', np.int8)])
 
 
-def calculate_data_size(client_cards: list, server_cards: list, num_rounds: int) -> int:
-    """
-    Calculate total data size sent for a game.
-    Base size: 33 bytes
-    Client cards: first 2 cards = 3 bytes each, rest = 8 bytes each
-    Server cards: all cards = 4 bytes each
-    Round results: 1 byte per round
-    """
-    base_size = 33
-    
-    # Client cards size
-    client_size = 0
-    for round_cards in client_cards:
-        for i, card in enumerate(round_cards):
-            if i < 2:
-                client_size += 3  # First 2 cards are 3 bytes
-            else:
-                client_size += 8  # Hit cards are 8 bytes
-    
-    # Server cards size
-    server_size = 0
-    for round_cards in server_cards:
-        for card in round_cards:
-            server_size += 4  # All server cards are 4 bytes
-    
-    # Round results
-    round_results_size = num_rounds
-    
-    return base_size + client_size + server_size + round_results_size
+def encode_hands(hands: list) -> tuple:
+    """Encode every card of the hands once into (rank_ids, suit_ids, bounds); hand h is [bounds[h], bounds[h + 1])"""
+    bounds = np.zeros(len(hands) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(hand) for hand in hands), dtype=np.int64, count=len(hands)), out=bounds[1:])
+    codes = np.fromiter(
+        ((RANK_IDS.get(card.get('rank'), UNKNOWN_RANK_ID), SUIT_IDS.get(card.get('suit'), UNKNOWN_SUIT_ID))
+         for hand in hands for card in hand),
+        dtype=CARD_CODE_DTYPE, count=int(bounds[-1])
+    )
+    return codes['rank'], codes['suit'], bounds
+
+
+def client_hand_bytes(hand_lens):
+    """Bytes sent for client hands of the given lengths (array or Series): first 2 cards 3 bytes each, hits 8 bytes each"""
+    return 3 * np.minimum(hand_lens, 2) + 8 * np.maximum(hand_lens - 2, 0)
+
+
+def summarize_times(times: np.ndarray) -> tuple:
+    """(mean, min, max, median) of a non-empty array - min, max and the median all come out of one partial partition"""
+    n = len(times)
+    mid = n // 2
+    # After partitioning on these positions each of them holds the value a full sort would put there
+    kth = sorted({0, (n - 1) // 2, mid, n - 1})
+    part = np.partition(times, kth)
+    median = part[mid] if n % 2 else (part[mid - 1] + part[mid]) / 2
+    return (float(part.mean()), float(part[0]), float(part[-1]), float(median))
+
+
+def _list_column(df: pd.DataFrame, name: str, kind: type = list) -> pd.Series:
+    """A list-valued (or dict-valued) column with missing values (absent key) replaced by empty ones"""
+    if name not in df:
+        return pd.Series([kind() for _ in range(len(df))], index=df.index, dtype=object)
+    return pd.Series([value if isinstance(value, kind) else kind() for value in df[name]], index=df.index, dtype=object)
+
+
+def _number_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """A numeric column with missing values (absent key) replaced by 0"""
+    if name not in df:
+        return pd.Series(0, index=df.index)
+    return df[name].fillna(0)
 
 
 def process_data(data: dict) -> dict:
@@ -93,112 +108,150 @@ def process_data(data: dict) -> dict:
         'total_ties': 0,
         'client_busts': 0,
         'server_busts': 0,
-        'client_hand_values': [],
-        'server_hand_values': [],
-        'hits_per_round': [],
-        'all_client_cards': [],
-        'all_server_cards': [],
-        'response_times': [],
-        'avg_response_per_game': [],
+        'client_hand_values': np.empty(0, dtype=np.int16),
+        'server_hand_values': np.empty(0, dtype=np.int16),
+        'hits_per_round': np.empty(0, dtype=np.uint8),
+        'hits_hist': np.zeros(0, dtype=np.int64),
+        'total_cards': 0,
+        'rank_counts': np.zeros(len(RANK_IDS), dtype=np.int64),
+        'suit_counts': np.zeros(len(SUIT_IDS), dtype=np.int64),
+        'response_times': np.empty(0, dtype=np.float32),
+        'response_time_summary': None,
+        'avg_response_per_game': pd.DataFrame(columns=['team', 'avg_time', 'total_time', 'rounds']),
         'teams': [],
-        'team_stats': [],
-        'game_times': [],
+        'team_stats': pd.DataFrame(columns=['team', 'client_wins', 'dealer_wins', 'ties', 'rounds', 'win_rate']),
+        'leaderboard': pd.DataFrame(columns=['team', 'client_wins', 'dealer_wins', 'ties', 'rounds', 'win_rate']),
+        'game_times': pd.DataFrame(columns=['team', 'time', 'rounds']),
         'total_game_time': 0,
-        'data_sizes': [],
+        'data_sizes': np.empty(0, dtype=np.int32),
         'total_data_size': 0,
-        'data_size_per_game': [],
+        'data_size_summary': (0, 0, 0),
+        'total_data_size_human': '0 B',
+        'data_size_per_game': pd.DataFrame(columns=['team', 'size', 'rounds']),
     }
+    if not data:
+        return stats
     
-    for game_id, game in data.items():
-        stats['total_games'] += 1
-        num_rounds = game.get('number_of_rounds', 0)
-        stats['total_rounds'] += num_rounds
-        
-        game_stats = game.get('game_stats', {})
-        client_wins = game_stats.get('3', 0)
-        dealer_wins = game_stats.get('2', 0)
-        ties = game_stats.get('1', 0)
-        
-        stats['client_wins'] += client_wins
-        stats['dealer_wins'] += dealer_wins
-        stats['total_ties'] += ties
-        
-        # Bust counts
-        stats['client_busts'] += len(game.get('client_round_busts', []))
-        stats['server_busts'] += len(game.get('server_round_busts', []))
-        
-        # Process cards
-        client_cards = game.get('client_game_cards', [])
-        server_cards = game.get('server_game_cards', [])
-        
-        for round_cards in client_cards:
-            if round_cards:
-                hand_value = calculate_hand_value(round_cards)
-                stats['client_hand_values'].append(hand_value)
-                hits = len(round_cards) - 2  # Initial 2 cards don't count as hits
-                stats['hits_per_round'].append(max(0, hits))
-                for card in round_cards:
-                    stats['all_client_cards'].append(card)
-        
-        for round_cards in server_cards:
-            if round_cards:
-                hand_value = calculate_hand_value(round_cards)
-                stats['server_hand_values'].append(hand_value)
-                for card in round_cards:
-                    stats['all_server_cards'].append(card)
-        
-        # Response times
-        response_times = game.get('client_response_time_in_game', [])
-        game_times = []
-        for round_times in response_times:
-            for t in round_times:
-                stats['response_times'].append(t)
-                game_times.append(t)
-        
-        if game_times:
-            stats['avg_response_per_game'].append({
-                'team': game.get('team_name', 'Unknown'),
-                'avg_time': np.mean(game_times),
-                'total_time': sum(game_times),
-                'rounds': num_rounds
-            })
-        
-        # Game time - always add even if 0, to avoid empty list issues
-        total_game_time = game.get('total_game_time', 0)
-        stats['game_times'].append({
-            'team': game.get('team_name', 'Unknown'),
-            'time': total_game_time,
-            'rounds': num_rounds
-        })
-        stats['total_game_time'] += total_game_time
-        
-        # Data size calculation
-        data_size = calculate_data_size(client_cards, server_cards, num_rounds)
-        stats['data_sizes'].append(data_size)
-        stats['total_data_size'] += data_size
-        stats['data_size_per_game'].append({
-            'team': game.get('team_name', 'Unknown'),
-            'size': data_size,
-            'rounds': num_rounds
-        })
-        
-        # Team stats
-        stats['teams'].append(game.get('team_name', 'Unknown'))
-        stats['team_stats'].append({
-            'team': game.get('team_name', 'Unknown'),
-            'client_wins': client_wins,
-            'dealer_wins': dealer_wins,
-            'ties': ties,
-            'rounds': num_rounds,
-            'win_rate': (client_wins / (client_wins + dealer_wins + ties) * 100) if (client_wins + dealer_wins + ties) > 0 else 0
-        })
+    # One row per game, plus one column per game_stats result key (3 = client win, 2 = dealer win, 1 = tie)
+    games = pd.DataFrame(list(data.values()))
+    if 'game_stats' in games:
+        game_stats = pd.DataFrame(_list_column(games, 'game_stats', dict).tolist(), index=games.index)
+        games = games.join(game_stats.add_prefix('game_stats.'))
+    
+    team = games['team_name'].fillna('Unknown') if 'team_name' in games else pd.Series('Unknown', index=games.index)
+    num_rounds = _number_column(games, 'number_of_rounds').astype(int)
+    client_wins = _number_column(games, 'game_stats.3').astype(int)
+    dealer_wins = _number_column(games, 'game_stats.2').astype(int)
+    ties = _number_column(games, 'game_stats.1').astype(int)
+    total_game_time = _number_column(games, 'total_game_time')
+    
+    stats['total_games'] = len(games)
+    stats['total_rounds'] = int(num_rounds.sum())
+    stats['client_wins'] = int(client_wins.sum())
+    stats['dealer_wins'] = int(dealer_wins.sum())
+    stats['total_ties'] = int(ties.sum())
+    stats['client_busts'] = int(_list_column(games, 'client_round_busts').str.len().sum())
+    stats['server_busts'] = int(_list_column(games, 'server_round_busts').str.len().sum())
+    
+    # One row per (game, round) hand, empty hands dropped; the index keeps the game row
+    client_hands = _list_column(games, 'client_game_cards').explode().dropna()
+    client_hands = client_hands[client_hands.str.len() > 0]
+    server_hands = _list_column(games, 'server_game_cards').explode().dropna()
+    server_hands = server_hands[server_hands.str.len() > 0]
+    client_hand_lens = client_hands.str.len()
+    server_hand_lens = server_hands.str.len()
+    
+    # Stored arrays use the narrowest dtype that holds them - hand totals and hit counts are small,
+    # response times don't need double precision and a game is far below 2 GiB of traffic
+    # Each card is encoded to small rank / suit ids once; hand totals and the card histograms all read those
+    client_ranks, client_suits, client_bounds = encode_hands(client_hands.tolist())
+    server_ranks, server_suits, server_bounds = encode_hands(server_hands.tolist())
+    stats['client_hand_values'] = reduce_hands(client_ranks, client_bounds, RANK_VALUE_LUT, ACE_RANK_ID).astype(np.int16)
+    stats['server_hand_values'] = reduce_hands(server_ranks, server_bounds, RANK_VALUE_LUT, ACE_RANK_ID).astype(np.int16)
+    # Initial 2 cards don't count as hits
+    stats['hits_per_round'] = (client_hand_lens - 2).clip(lower=0).to_numpy(dtype=np.uint8)
+    # Rounds by hit count (index = hits), shared by both hit charts
+    stats['hits_hist'] = np.bincount(stats['hits_per_round'])
+    
+    # Rank / suit histograms over every dealt card (counts indexed like RANK_IDS / SUIT_IDS)
+    rank_ids = np.concatenate([client_ranks, server_ranks])
+    suit_ids = np.concatenate([client_suits, server_suits])
+    stats['total_cards'] = len(rank_ids)
+    stats['rank_counts'] = np.bincount(rank_ids, minlength=UNKNOWN_RANK_ID + 1)[:UNKNOWN_RANK_ID]
+    stats['suit_counts'] = np.bincount(suit_ids, minlength=UNKNOWN_SUIT_ID + 1)[:UNKNOWN_SUIT_ID]
+    
+    # Response times: flattened in one pass, one entry per decision indexed by its game row
+    game_rounds = _list_column(games, 'client_response_time_in_game')
+    decisions_per_game = np.fromiter((sum(map(len, rounds)) for rounds in game_rounds), dtype=np.int64, count=len(game_rounds))
+    response_times = pd.Series(
+        np.fromiter(itertools.chain.from_iterable(itertools.chain.from_iterable(game_rounds)), dtype=np.float64,
+                    count=int(decisions_per_game.sum())),
+        index=np.repeat(games.index, decisions_per_game),
+    )
+    if len(response_times):
+        stats['response_time_summary'] = summarize_times(response_times.to_numpy())
+    stats['response_times'] = response_times.to_numpy(dtype=np.float32)
+    per_game_times = response_times.groupby(level=0).agg(['mean', 'sum'])
+    stats['avg_response_per_game'] = pd.DataFrame({
+        'team': team[per_game_times.index],
+        'avg_time': per_game_times['mean'],
+        'total_time': per_game_times['sum'],
+        'rounds': num_rounds[per_game_times.index],
+    }).sort_values('avg_time', ascending=True, ignore_index=True)
+    
+    # Game time - always add even if 0, to avoid empty list issues
+    # The per-game tables are stored in the order their bar charts show them (ascending), sorted once here
+    stats['game_times'] = pd.DataFrame({'team': team, 'time': total_game_time, 'rounds': num_rounds}).sort_values('time', ascending=True)
+    stats['total_game_time'] = total_game_time.sum()
+    
+    # Data size per game: 33 base bytes, first 2 client cards of a hand 3 bytes
+    # each and hits 8 bytes each, every dealer card 4 bytes, 1 byte per round result
+    client_size = client_hand_bytes(client_hand_lens).groupby(level=0).sum()
+    server_size = (4 * server_hand_lens).groupby(level=0).sum()
+    data_sizes = (33 + num_rounds + client_size.reindex(games.index, fill_value=0)
+                  + server_size.reindex(games.index, fill_value=0)).astype(np.int32)
+    stats['data_sizes'] = data_sizes.to_numpy()
+    stats['total_data_size'] = int(data_sizes.sum())
+    total_bytes = stats['total_data_size']
+    stats['total_data_size_human'] = f"{total_bytes/1024:.2f} KB" if total_bytes >= 1024 else f"{total_bytes} B"
+    # (mean, min, max) for the data size cards, reduced once here instead of on every render
+    stats['data_size_summary'] = (float(data_sizes.mean()), int(data_sizes.min()), int(data_sizes.max()))
+    stats['data_size_per_game'] = pd.DataFrame({'team': team, 'size': data_sizes, 'rounds': num_rounds}).sort_values('size', ascending=True)
+    
+    # Team stats
+    rounds_played = client_wins + dealer_wins + ties
+    stats['teams'] = team.tolist()
+    stats['team_stats'] = pd.DataFrame({
+        'team': team,
+        'client_wins': client_wins,
+        'dealer_wins': dealer_wins,
+        'ties': ties,
+        'rounds': num_rounds,
+        'win_rate': (client_wins / rounds_played.where(rounds_played > 0) * 100).fillna(0),
+    })
+    # Leaderboard order (podium and full table), sorted here so it is cached with the rest of the stats
+    stats['leaderboard'] = stats['team_stats'].sort_values(['win_rate', 'client_wins'], ascending=[False, False])
     
     return stats
 
 
-def inject_css():
-    """Inject custom CSS"""
-    st.markdown("""
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_stats(file_path: str, mtime_ns: int, size: int):
+    """Load and process the data file, or None without data; cached until the file's mtime or size changes"""
+    data = load_data(file_path)
+    return process_data(data) if data else None
+
+
+def data_file_version(file_path: str = DATA_FILE) -> tuple:
+    """(mtime_ns, size) of the data file, the cache key for load_stats"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+_DASHBOARD_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
     
@@ -210,13 +263,13 @@ def inject_css():
         text-align: center !important;
     }
     
-    /* Center tabs */
-    .stTabs [data-baseweb="tab-list"] {
+    /* Center the view selector */
+    .stRadio [role="radiogroup"] {
         justify-content: center;
         gap: 1rem;
     }
     
-    .stTabs [data-baseweb="tab"] {
+    .stRadio [role="radiogroup"] label {
         padding: 0.5rem 1.5rem;
     }
     
@@ -246,6 +299,15 @@ def inject_css():
         transition: transform 0.3s ease, box-shadow 0.3s ease;
     }
     
+    .stat-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .stat-row > .stat-card {
+        flex: 1;
+    }
+    
     .stat-card:hover {
         transform: translateY(-5px);
         box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
@@ -296,7 +358,20 @@ def inject_css():
     .hearts, .diamonds { color: #e63946; }
     .clubs, .spades { color: #1d3557; }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _css_blob() -> str:
+    """Whitespace-collapsed stylesheet, computed once per server process"""
+    return re.sub(r"\s+", " ", _DASHBOARD_CSS).strip()
+
+
+def inject_css():
+    """Inject custom CSS"""
+    # Emitted on every rerun on purpose: Streamlit removes elements a rerun doesn't re-emit,
+    # so a once-per-session guard would drop the styling after the first interaction.
+    st.markdown(_css_blob(), unsafe_allow_html=True)
 
 
 def render_stat_card(value, label, color_class="neutral"):
@@ -309,651 +384,655 @@ def render_stat_card(value, label, color_class="neutral"):
     """
 
 
-def main():
-    st.set_page_config(
-        page_title="Blackjack Statistics",
-        page_icon="📊",
-        layout="wide"
+def render_stat_row(cards: list) -> str:
+    """Render a row of statistic cards, given as (value, label, color_class) tuples, as one markdown block"""
+    # Cards are joined without blank lines - a blank line would end the HTML block and the indented card lines
+    # after it would be read as a markdown code block
+    return '<div class="stat-row">' + "".join(render_stat_card(*card).strip() for card in cards) + '</div>'
+
+
+def histogram_bar(values, bins, **trace_kwargs) -> go.Bar:
+    """A go.Histogram look-alike binned here, so the chart ships bin counts to the browser instead of every value"""
+    counts, edges = np.histogram(values, bins=bins)
+    return go.Bar(x=((edges[:-1] + edges[1:]) / 2).astype(np.float32), y=counts.astype(np.int32),
+                  width=np.diff(edges).astype(np.float32), **trace_kwargs)
+
+
+def unit_bins(values: np.ndarray) -> np.ndarray:
+    """Bin edges giving every integer value between the min and max its own bar"""
+    return np.arange(values.min(), values.max() + 2) - 0.5
+
+
+# Figure builders for the fixed charts - st.cache_resource hands back the same figure while the inputs are unchanged,
+# so a rerun skips rebuilding it (the figures are only read after this, never modified).
+# Plotly ships numpy arrays to the browser as typed binary in their own dtype, so numeric trace data is
+# handed over as float32 / int32 - half the bytes of the float64 / int64 pandas would give it.
+@st.cache_resource(max_entries=8)
+def results_pie(client_wins: int, dealer_wins: int, ties: int, height: int) -> go.Figure:
+    """Donut chart of client wins / dealer wins / ties"""
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=['Client Wins', 'Dealer Wins', 'Ties'],
+        values=[client_wins, dealer_wins, ties],
+        hole=0.4,
+        marker_colors=['#4caf50', '#f44336', '#ff9800'],
+        textinfo='label+percent',
+        textfont_size=14
+    )])
+    fig_pie.update_layout(
+        title="Overall Results Distribution",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=True,
+        legend=dict(font=dict(color='white')),
+        height=height
+    )
+    return fig_pie
+
+
+@st.cache_resource(max_entries=8)
+def bust_bar(client_busts: int, server_busts: int) -> go.Figure:
+    """Bar chart comparing client and dealer busts"""
+    fig_bust = go.Figure()
+    fig_bust.add_trace(go.Bar(
+        x=['Client Busts', 'Dealer Busts'],
+        y=[client_busts, server_busts],
+        marker_color=['#f44336', '#9c27b0'],
+        text=[client_busts, server_busts],
+        textposition='outside'
+    ))
+    fig_bust.update_layout(
+        title="Bust Comparison",
+        yaxis_title="Count",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_bust
+
+
+@st.cache_resource(max_entries=8)
+def hand_value_hist(hand_values: np.ndarray, title: str, name: str, color: str) -> go.Figure:
+    """Histogram of final hand values (one bar per total) with a marker at 21"""
+    fig_hist = go.Figure()
+    fig_hist.add_trace(histogram_bar(
+        hand_values,
+        unit_bins(hand_values),
+        marker_color=color,
+        opacity=0.8,
+        name=name
+    ))
+    fig_hist.update_layout(
+        title=title,
+        xaxis_title="Hand Value",
+        yaxis_title="Frequency",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        bargap=0.1,
+        height=400
+    )
+    fig_hist.add_vline(x=21, line_dash="dash", line_color="#4caf50", annotation_text="21")
+    return fig_hist
+
+
+@st.cache_resource(max_entries=8)
+def rank_bar(rank_counts: tuple) -> go.Figure:
+    """Bar chart of dealt cards per rank, counts given in RANK_IDS order"""
+    ranks = list(RANK_IDS)
+    fig_ranks = go.Figure()
+    fig_ranks.add_trace(go.Bar(
+        x=ranks,
+        y=list(rank_counts),
+        marker_color=['#e63946' if r == 'A' else '#2196f3' for r in ranks],
+        text=list(rank_counts),
+        textposition='outside'
+    ))
+    fig_ranks.update_layout(
+        title="Card Rank Distribution (All Games)",
+        xaxis_title="Rank",
+        yaxis_title="Frequency",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=400
+    )
+    return fig_ranks
+
+
+@st.cache_resource(max_entries=8)
+def suit_pie(suit_counts: tuple) -> go.Figure:
+    """Donut chart of dealt cards per suit, counts given in SUIT_IDS order"""
+    fig_suits = go.Figure(data=[go.Pie(
+        labels=[f"{SUIT_SYMBOLS[s]} {s}" for s in SUIT_IDS],
+        values=list(suit_counts),
+        hole=0.3,
+        marker_colors=['#e63946', '#e63946', '#1d3557', '#1d3557'],
+        textinfo='label+percent'
+    )])
+    fig_suits.update_layout(
+        title="Suit Distribution",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=400
+    )
+    return fig_suits
+
+
+@st.cache_resource(max_entries=8)
+def response_time_hist(response_times: np.ndarray) -> go.Figure:
+    """Histogram of every client response time"""
+    fig_rt_hist = go.Figure()
+    fig_rt_hist.add_trace(histogram_bar(
+        response_times,
+        20,
+        marker_color='#00bcd4',
+        opacity=0.8
+    ))
+    fig_rt_hist.update_layout(
+        title="Response Time Distribution",
+        xaxis_title="Response Time (seconds)",
+        yaxis_title="Frequency",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_rt_hist
+
+
+@st.cache_resource(max_entries=8)
+def avg_response_bar(avg_response_per_game: pd.DataFrame) -> go.Figure:
+    """Horizontal bar chart of average response time per game, in the given (fastest first) order"""
+    fig_rt_bar = go.Figure()
+    fig_rt_bar.add_trace(go.Bar(
+        x=avg_response_per_game['avg_time'].to_numpy(dtype=np.float32),
+        y=avg_response_per_game['team'],
+        orientation='h',
+        marker_color='#00bcd4',
+        texttemplate='%{x:.2f}s',
+        textposition='outside'
+    ))
+    fig_rt_bar.update_layout(
+        title="Average Response Time by Team",
+        xaxis_title="Average Response Time (s)",
+        yaxis_title="",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_rt_bar
+
+
+@st.cache_resource(max_entries=8)
+def game_time_bar(game_times: pd.DataFrame) -> go.Figure:
+    """Horizontal bar chart of total game time per game, in the given (shortest first) order"""
+    # Bar labels are formatted by plotly.js from the x values (texttemplate) - no per-row strings built here
+    fig_game_time = go.Figure()
+    fig_game_time.add_trace(go.Bar(
+        x=game_times['time'].to_numpy(dtype=np.float32),
+        y=game_times['team'],
+        orientation='h',
+        marker_color='#9c27b0',
+        texttemplate='%{x:.1f}s',
+        textposition='outside'
+    ))
+    fig_game_time.update_layout(
+        title="Game Time by Team",
+        xaxis_title="Total Game Time (s)",
+        yaxis_title="",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_game_time
+
+
+@st.cache_resource(max_entries=8)
+def game_time_hist(times: pd.Series) -> go.Figure:
+    """Histogram of total game times"""
+    fig_time_hist = go.Figure()
+    fig_time_hist.add_trace(histogram_bar(
+        times,
+        15,
+        marker_color='#9c27b0',
+        opacity=0.8
+    ))
+    fig_time_hist.update_layout(
+        title="Game Time Distribution",
+        xaxis_title="Game Time (seconds)",
+        yaxis_title="Frequency",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_time_hist
+
+
+@st.cache_resource(max_entries=8)
+def data_size_bar(data_size_per_game: pd.DataFrame) -> go.Figure:
+    """Horizontal bar chart of bytes sent per game, in the given (smallest first) order"""
+    fig_data_size = go.Figure()
+    fig_data_size.add_trace(go.Bar(
+        x=data_size_per_game['size'].to_numpy(dtype=np.int32),
+        y=data_size_per_game['team'],
+        orientation='h',
+        marker_color='#ff9800',
+        texttemplate='%{x} B',
+        textposition='outside'
+    ))
+    fig_data_size.update_layout(
+        title="Data Size by Team",
+        xaxis_title="Data Size (bytes)",
+        yaxis_title="",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
+    )
+    return fig_data_size
+
+
+@st.cache_resource(max_entries=8)
+def data_size_hist(data_sizes: np.ndarray) -> go.Figure:
+    """Histogram of bytes sent per game"""
+    fig_size_hist = go.Figure()
+    fig_size_hist.add_trace(histogram_bar(
+        data_sizes,
+        15,
+        marker_color='#4caf50',
+        opacity=0.8
+    ))
+    fig_size_hist.update_layout(
+        title="Data Size Distribution",
+        xaxis_title="Data Size (bytes)",
+        yaxis_title="Frequency",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        height=350
     )
+    return fig_size_hist
+
+
+@st.cache_resource(max_entries=8)
+def leaderboard_table(team_df: pd.DataFrame) -> pd.DataFrame:
+    """Full leaderboard table with display column names, teams in the order given"""
+    return team_df[['team', 'client_wins', 'dealer_wins', 'ties', 'rounds', 'win_rate']].rename(columns={
+        'team': 'Team',
+        'client_wins': 'Client Wins',
+        'dealer_wins': 'Dealer Wins',
+        'ties': 'Ties',
+        'rounds': 'Rounds',
+        'win_rate': 'Win Rate %'
+    })
+
+
+# One podium card - filled in with str.format, so the markup is parsed once here rather than on every render
+PODIUM_CARD_TPL = (
+    '<div class="stat-card" style="border: 2px solid {color};">'
+    '<div style="font-size: {medal_size};">{medal}</div>'
+    '<div class="stat-value" style="font-size: {name_size}; color: {color};">{team}</div>'
+    '<div class="stat-label">{rate:.1f}% Win Rate</div>'
+    '</div>'
+)
+# Silver, gold, bronze from left to right, as (leaderboard place, card style)
+PODIUM_SLOTS = (
+    (1, dict(medal="🥈", color="#c0c0c0", medal_size="2rem", name_size="1.5rem")),
+    (0, dict(medal="🥇", color="#ffd700", medal_size="2.5rem", name_size="1.8rem")),
+    (2, dict(medal="🥉", color="#cd7f32", medal_size="2rem", name_size="1.5rem")),
+)
+
+# Win rate drawn by the frontend as a bar in its cell - no per-cell styling computed (or sent) from here
+LEADERBOARD_COLUMN_CONFIG = {
+    'Win Rate %': st.column_config.ProgressColumn('Win Rate %', min_value=0, max_value=100, format='%.1f%%'),
+}
+
+
+def render_overview(stats: dict):
+    """Overview tab"""
+    st.markdown('<div class="section-title">📈 OVERVIEW</div>', unsafe_allow_html=True)
     
-    inject_css()
+    st.markdown(render_stat_row([
+        (stats['total_games'], "Total Games", "neutral"),
+        (stats['total_rounds'], "Total Rounds", "cyan"),
+        (stats['client_wins'], "Client Wins", "win"),
+        (stats['dealer_wins'], "Dealer Wins", "loss"),
+        (stats['total_ties'], "Ties", "tie"),
+    ]), unsafe_allow_html=True)
     
-    # Title
-    st.markdown('<div class="main-title">📊 BLACKJACK STATISTICS</div>', unsafe_allow_html=True)
-    st.markdown('<div class="subtitle">GAME ANALYTICS DASHBOARD</div>', unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
     
-    # Load and process data
-    data = load_data()
+    # Win Rate and Bust Rates
+    total_results = stats['client_wins'] + stats['dealer_wins'] + stats['total_ties']
+    win_rate = (stats['client_wins'] / total_results * 100) if total_results > 0 else 0
+    client_bust_rate = (stats['client_busts'] / stats['total_rounds'] * 100) if stats['total_rounds'] > 0 else 0
+    server_bust_rate = (stats['server_busts'] / stats['total_rounds'] * 100) if stats['total_rounds'] > 0 else 0
     
-    if not data:
-        st.error("No data found. Please ensure db_mock.json is in the same directory.")
-        return
+    avg_hits = stats['hits_per_round'].mean() if len(stats['hits_per_round']) else 0
     
-    stats = process_data(data)
-    
-    # ==================== TABS ====================
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "📈 Overview",
-        "🎯 Results",
-        "🃏 Hand Values",
-        "🎴 Cards",
-        "⏱️ Time & Data",
-        "🏆 Leaderboard"
-    ])
-    
-    # ==================== TAB 1: OVERVIEW ====================
-    with tab1:
-        st.markdown('<div class="section-title">📈 OVERVIEW</div>', unsafe_allow_html=True)
-        
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.markdown(render_stat_card(stats['total_games'], "Total Games", "neutral"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(stats['total_rounds'], "Total Rounds", "cyan"), unsafe_allow_html=True)
-        with col3:
-            st.markdown(render_stat_card(stats['client_wins'], "Client Wins", "win"), unsafe_allow_html=True)
-        with col4:
-            st.markdown(render_stat_card(stats['dealer_wins'], "Dealer Wins", "loss"), unsafe_allow_html=True)
-        with col5:
-            st.markdown(render_stat_card(stats['total_ties'], "Ties", "tie"), unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Win Rate and Bust Rates
-        total_results = stats['client_wins'] + stats['dealer_wins'] + stats['total_ties']
-        win_rate = (stats['client_wins'] / total_results * 100) if total_results > 0 else 0
-        client_bust_rate = (stats['client_busts'] / stats['total_rounds'] * 100) if stats['total_rounds'] > 0 else 0
-        server_bust_rate = (stats['server_busts'] / stats['total_rounds'] * 100) if stats['total_rounds'] > 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(render_stat_card(f"{win_rate:.1f}%", "Client Win Rate", "win"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(f"{client_bust_rate:.1f}%", "Client Bust Rate", "loss"), unsafe_allow_html=True)
-        with col3:
-            st.markdown(render_stat_card(f"{server_bust_rate:.1f}%", "Dealer Bust Rate", "purple"), unsafe_allow_html=True)
-        with col4:
-            avg_hits = np.mean(stats['hits_per_round']) if stats['hits_per_round'] else 0
-            st.markdown(render_stat_card(f"{avg_hits:.2f}", "Avg Hits/Round", "cyan"), unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Quick summary pie chart
-        col1, col2 = st.columns(2)
-        with col1:
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=['Client Wins', 'Dealer Wins', 'Ties'],
-                values=[stats['client_wins'], stats['dealer_wins'], stats['total_ties']],
-                hole=0.4,
-                marker_colors=['#4caf50', '#f44336', '#ff9800'],
-                textinfo='label+percent',
-                textfont_size=14
-            )])
-            fig_pie.update_layout(
-                title="Overall Results Distribution",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                showlegend=True,
-                legend=dict(font=dict(color='white')),
-                height=350
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-        
-        with col2:
-            # Bust comparison
-            fig_bust = go.Figure()
-            fig_bust.add_trace(go.Bar(
-                x=['Client Busts', 'Dealer Busts'],
-                y=[stats['client_busts'], stats['server_busts']],
-                marker_color=['#f44336', '#9c27b0'],
-                text=[stats['client_busts'], stats['server_busts']],
-                textposition='outside'
-            ))
-            fig_bust.update_layout(
-                title="Bust Comparison",
-                yaxis_title="Count",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                height=350
-            )
-            st.plotly_chart(fig_bust, use_container_width=True)
+    st.markdown(render_stat_row([
+        (f"{win_rate:.1f}%", "Client Win Rate", "win"),
+        (f"{client_bust_rate:.1f}%", "Client Bust Rate", "loss"),
+        (f"{server_bust_rate:.1f}%", "Dealer Bust Rate", "purple"),
+        (f"{avg_hits:.2f}", "Avg Hits/Round", "cyan"),
+    ]), unsafe_allow_html=True)
     
-    # ==================== TAB 2: RESULTS ====================
-    with tab2:
-        st.markdown('<div class="section-title">🎯 GAME RESULTS DISTRIBUTION</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Pie chart for overall results
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=['Client Wins', 'Dealer Wins', 'Ties'],
-                values=[stats['client_wins'], stats['dealer_wins'], stats['total_ties']],
-                hole=0.4,
-                marker_colors=['#4caf50', '#f44336', '#ff9800'],
-                textinfo='label+percent',
-                textfont_size=14
-            )])
-            fig_pie.update_layout(
-                title="Overall Results Distribution",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                showlegend=True,
-                legend=dict(font=dict(color='white')),
-                height=400
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-        
-        with col2:
-            # Bar chart for team performance
-            team_df = pd.DataFrame(stats['team_stats'])
-            team_df = team_df.sort_values('win_rate', ascending=True).tail(10)
-            
-            fig_bar = go.Figure()
-            fig_bar.add_trace(go.Bar(
-                y=team_df['team'],
-                x=team_df['client_wins'],
-                name='Client Wins',
-                orientation='h',
-                marker_color='#4caf50'
-            ))
-            fig_bar.add_trace(go.Bar(
-                y=team_df['team'],
-                x=team_df['dealer_wins'],
-                name='Dealer Wins',
-                orientation='h',
-                marker_color='#f44336'
-            ))
-            fig_bar.add_trace(go.Bar(
-                y=team_df['team'],
-                x=team_df['ties'],
-                name='Ties',
-                orientation='h',
-                marker_color='#ff9800'
-            ))
-            fig_bar.update_layout(
-                title="Top 10 Teams by Win Rate",
-                barmode='stack',
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                xaxis_title="Games",
-                yaxis_title="",
-                legend=dict(font=dict(color='white')),
-                height=400
-            )
-            st.plotly_chart(fig_bar, use_container_width=True)
-        
-        # Hits analysis
-        st.markdown('<div class="section-title">👆 HITS PER ROUND ANALYSIS</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if stats['hits_per_round']:
-                hit_counts = Counter(stats['hits_per_round'])
-                max_hits = max(stats['hits_per_round']) if stats['hits_per_round'] else 0
-                
-                fig_hits = go.Figure()
-                fig_hits.add_trace(go.Bar(
-                    x=list(range(max_hits + 1)),
-                    y=[hit_counts.get(i, 0) for i in range(max_hits + 1)],
-                    marker_color='#ff9800',
-                    text=[hit_counts.get(i, 0) for i in range(max_hits + 1)],
-                    textposition='outside'
-                ))
-                fig_hits.update_layout(
-                    title="Hits Per Round Distribution",
-                    xaxis_title="Number of Hits",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_hits, use_container_width=True)
-        
-        with col2:
-            hit_categories = ['0 Hits\n(Stand)', '1 Hit', '2 Hits', '3+ Hits']
-            stand_rounds = sum(1 for h in stats['hits_per_round'] if h == 0)
-            one_hit = sum(1 for h in stats['hits_per_round'] if h == 1)
-            two_hits = sum(1 for h in stats['hits_per_round'] if h == 2)
-            three_plus = sum(1 for h in stats['hits_per_round'] if h >= 3)
-            
-            fig_hit_dist = go.Figure()
-            fig_hit_dist.add_trace(go.Bar(
-                x=hit_categories,
-                y=[stand_rounds, one_hit, two_hits, three_plus],
-                marker_color=['#4caf50', '#2196f3', '#ff9800', '#f44336'],
-                text=[stand_rounds, one_hit, two_hits, three_plus],
-                textposition='outside'
-            ))
-            fig_hit_dist.update_layout(
-                title="Player Decision Distribution",
-                xaxis_title="Strategy",
-                yaxis_title="Number of Rounds",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                height=350
-            )
-            st.plotly_chart(fig_hit_dist, use_container_width=True)
+    st.markdown("<br>", unsafe_allow_html=True)
     
-    # ==================== TAB 3: HAND VALUES ====================
-    with tab3:
-        st.markdown('<div class="section-title">🃏 HAND VALUE ANALYSIS</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if stats['client_hand_values']:
-                fig_hist_player = go.Figure()
-                fig_hist_player.add_trace(go.Histogram(
-                    x=stats['client_hand_values'],
-                    nbinsx=15,
-                    marker_color='#2196f3',
-                    opacity=0.8,
-                    name='Player Hands'
-                ))
-                fig_hist_player.update_layout(
-                    title="Player Final Hand Values",
-                    xaxis_title="Hand Value",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    bargap=0.1,
-                    height=400
-                )
-                fig_hist_player.add_vline(x=21, line_dash="dash", line_color="#4caf50", annotation_text="21")
-                st.plotly_chart(fig_hist_player, use_container_width=True)
-        
-        with col2:
-            if stats['server_hand_values']:
-                fig_hist_dealer = go.Figure()
-                fig_hist_dealer.add_trace(go.Histogram(
-                    x=stats['server_hand_values'],
-                    nbinsx=15,
-                    marker_color='#9c27b0',
-                    opacity=0.8,
-                    name='Dealer Hands'
-                ))
-                fig_hist_dealer.update_layout(
-                    title="Dealer Final Hand Values",
-                    xaxis_title="Hand Value",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    bargap=0.1,
-                    height=400
-                )
-                fig_hist_dealer.add_vline(x=21, line_dash="dash", line_color="#4caf50", annotation_text="21")
-                st.plotly_chart(fig_hist_dealer, use_container_width=True)
-        
-        # Average hand values
-        avg_player_hand = np.mean(stats['client_hand_values']) if stats['client_hand_values'] else 0
-        avg_dealer_hand = np.mean(stats['server_hand_values']) if stats['server_hand_values'] else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(render_stat_card(f"{avg_player_hand:.1f}", "Avg Player Hand", "neutral"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(f"{avg_dealer_hand:.1f}", "Avg Dealer Hand", "purple"), unsafe_allow_html=True)
-        with col3:
-            max_player = max(stats['client_hand_values']) if stats['client_hand_values'] else 0
-            st.markdown(render_stat_card(max_player, "Max Player Hand", "win"), unsafe_allow_html=True)
-        with col4:
-            blackjacks = sum(1 for v in stats['client_hand_values'] if v == 21)
-            st.markdown(render_stat_card(blackjacks, "Player Blackjacks", "cyan"), unsafe_allow_html=True)
-    
-    # ==================== TAB 4: CARDS ====================
-    with tab4:
-        st.markdown('<div class="section-title">🎴 CARD STATISTICS</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
+    # Quick summary pie chart
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(results_pie(stats['client_wins'], stats['dealer_wins'], stats['total_ties'], 350), use_container_width=True)
+    
+    with col2:
+        # Bust comparison
+        st.plotly_chart(bust_bar(stats['client_busts'], stats['server_busts']), use_container_width=True)
+
+
+def render_results(stats: dict):
+    """Results tab"""
+    st.markdown('<div class="section-title">🎯 GAME RESULTS DISTRIBUTION</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Pie chart for overall results
+        st.plotly_chart(results_pie(stats['client_wins'], stats['dealer_wins'], stats['total_ties'], 400), use_container_width=True)
+    
+    with col2:
+        # Bar chart for team performance
+        # Top 10 by win rate, best last so it ends up at the top of the bars. The sort is stable, so teams
+        # tied at the cut-off are picked by their order in team_stats, the same every run
+        team_df = stats['team_stats'].sort_values('win_rate', ascending=True, kind='stable').tail(10)
         
-        with col1:
-            all_cards = stats['all_client_cards'] + stats['all_server_cards']
-            rank_counts = Counter([card['rank'] for card in all_cards])
-            
-            ranks_order = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-            rank_data = [(r, rank_counts.get(r, 0)) for r in ranks_order]
-            
-            fig_ranks = go.Figure()
-            fig_ranks.add_trace(go.Bar(
-                x=[r[0] for r in rank_data],
-                y=[r[1] for r in rank_data],
-                marker_color=['#e63946' if r[0] == 'A' else '#2196f3' for r in rank_data],
-                text=[r[1] for r in rank_data],
+        fig_bar = go.Figure()
+        fig_bar.add_trace(go.Bar(
+            y=team_df['team'],
+            x=team_df['client_wins'],
+            name='Client Wins',
+            orientation='h',
+            marker_color='#4caf50'
+        ))
+        fig_bar.add_trace(go.Bar(
+            y=team_df['team'],
+            x=team_df['dealer_wins'],
+            name='Dealer Wins',
+            orientation='h',
+            marker_color='#f44336'
+        ))
+        fig_bar.add_trace(go.Bar(
+            y=team_df['team'],
+            x=team_df['ties'],
+            name='Ties',
+            orientation='h',
+            marker_color='#ff9800'
+        ))
+        fig_bar.update_layout(
+            title="Top 10 Teams by Win Rate",
+            barmode='stack',
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font_color='white',
+            xaxis_title="Games",
+            yaxis_title="",
+            legend=dict(font=dict(color='white')),
+            height=400
+        )
+        st.plotly_chart(fig_bar, use_container_width=True)
+    
+    # Hits analysis
+    st.markdown('<div class="section-title">👆 HITS PER ROUND ANALYSIS</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        hits_hist = stats['hits_hist']
+        if len(hits_hist):
+            fig_hits = go.Figure()
+            fig_hits.add_trace(go.Bar(
+                x=list(range(len(hits_hist))),
+                y=hits_hist.tolist(),
+                marker_color='#ff9800',
+                text=hits_hist.tolist(),
                 textposition='outside'
             ))
-            fig_ranks.update_layout(
-                title="Card Rank Distribution (All Games)",
-                xaxis_title="Rank",
+            fig_hits.update_layout(
+                title="Hits Per Round Distribution",
+                xaxis_title="Number of Hits",
                 yaxis_title="Frequency",
                 paper_bgcolor='rgba(0,0,0,0)',
                 plot_bgcolor='rgba(0,0,0,0)',
                 font_color='white',
-                height=400
-            )
-            st.plotly_chart(fig_ranks, use_container_width=True)
-        
-        with col2:
-            suit_counts = Counter([card['suit'] for card in all_cards])
-            
-            suit_labels = [f"{SUIT_SYMBOLS.get(s, s)} {s}" for s in ['H', 'D', 'C', 'S']]
-            suit_values = [suit_counts.get(s, 0) for s in ['H', 'D', 'C', 'S']]
-            
-            fig_suits = go.Figure(data=[go.Pie(
-                labels=suit_labels,
-                values=suit_values,
-                hole=0.3,
-                marker_colors=['#e63946', '#e63946', '#1d3557', '#1d3557'],
-                textinfo='label+percent'
-            )])
-            fig_suits.update_layout(
-                title="Suit Distribution",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                height=400
+                height=350
             )
-            st.plotly_chart(fig_suits, use_container_width=True)
-        
-        # Card stats
-        all_cards = stats['all_client_cards'] + stats['all_server_cards']
-        rank_counts = Counter([card['rank'] for card in all_cards])
-        ace_count = rank_counts.get('A', 0)
-        total_cards = len(all_cards)
-        ace_frequency = (ace_count / total_cards * 100) if total_cards > 0 else 0
-        most_common_rank = rank_counts.most_common(1)[0] if rank_counts else ('N/A', 0)
-        face_cards = sum(rank_counts.get(r, 0) for r in ['J', 'Q', 'K'])
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(render_stat_card(total_cards, "Total Cards Dealt", "neutral"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(f"{ace_frequency:.1f}%", "Ace Frequency", "loss"), unsafe_allow_html=True)
-        with col3:
-            st.markdown(render_stat_card(most_common_rank[0], "Most Common Rank", "win"), unsafe_allow_html=True)
-        with col4:
-            st.markdown(render_stat_card(face_cards, "Face Cards (J/Q/K)", "purple"), unsafe_allow_html=True)
-    
-    # ==================== TAB 5: TIME & DATA ====================
-    with tab5:
-        st.markdown('<div class="section-title">⏱️ RESPONSE TIME ANALYSIS</div>', unsafe_allow_html=True)
-        
-        # Response time stats cards
-        if stats['response_times']:
-            avg_rt = np.mean(stats['response_times'])
-            min_rt = np.min(stats['response_times'])
-            max_rt = np.max(stats['response_times'])
-            median_rt = np.median(stats['response_times'])
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.markdown(render_stat_card(f"{avg_rt:.2f}s", "Avg Response Time", "cyan"), unsafe_allow_html=True)
-            with col2:
-                st.markdown(render_stat_card(f"{min_rt:.2f}s", "Fastest Response", "win"), unsafe_allow_html=True)
-            with col3:
-                st.markdown(render_stat_card(f"{max_rt:.2f}s", "Slowest Response", "loss"), unsafe_allow_html=True)
-            with col4:
-                st.markdown(render_stat_card(f"{median_rt:.2f}s", "Median Response", "purple"), unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if stats['response_times']:
-                fig_rt_hist = go.Figure()
-                fig_rt_hist.add_trace(go.Histogram(
-                    x=stats['response_times'],
-                    nbinsx=20,
-                    marker_color='#00bcd4',
-                    opacity=0.8
-                ))
-                fig_rt_hist.update_layout(
-                    title="Response Time Distribution",
-                    xaxis_title="Response Time (seconds)",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_rt_hist, use_container_width=True)
-        
-        with col2:
-            if stats['avg_response_per_game']:
-                rt_df = pd.DataFrame(stats['avg_response_per_game'])
-                rt_df = rt_df.sort_values('avg_time', ascending=True)
-                
-                fig_rt_bar = go.Figure()
-                fig_rt_bar.add_trace(go.Bar(
-                    x=rt_df['avg_time'],
-                    y=rt_df['team'],
-                    orientation='h',
-                    marker_color='#00bcd4',
-                    text=[f"{t:.2f}s" for t in rt_df['avg_time']],
-                    textposition='outside'
-                ))
-                fig_rt_bar.update_layout(
-                    title="Average Response Time by Team",
-                    xaxis_title="Average Response Time (s)",
-                    yaxis_title="",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_rt_bar, use_container_width=True)
-        
-        st.markdown('<div class="section-title">🕐 GAME TIME ANALYTICS</div>', unsafe_allow_html=True)
-        
-        # Game Time Stats
-        game_times_values = [g['time'] for g in stats['game_times']] if stats['game_times'] else [0]
-        avg_game_time = np.mean(game_times_values)
-        min_game_time = min(game_times_values)
-        max_game_time = max(game_times_values)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(render_stat_card(f"{stats['total_game_time']:.1f}s", "Total Game Time", "cyan"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(f"{avg_game_time:.1f}s", "Avg Game Time", "neutral"), unsafe_allow_html=True)
-        with col3:
-            st.markdown(render_stat_card(f"{min_game_time:.1f}s", "Fastest Game", "win"), unsafe_allow_html=True)
-        with col4:
-            st.markdown(render_stat_card(f"{max_game_time:.1f}s", "Longest Game", "loss"), unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Game time by team
-            if stats['game_times']:
-                game_time_df = pd.DataFrame(stats['game_times'])
-                game_time_df = game_time_df.sort_values('time', ascending=True)
-                
-                fig_game_time = go.Figure()
-                fig_game_time.add_trace(go.Bar(
-                    x=game_time_df['time'],
-                    y=game_time_df['team'],
-                    orientation='h',
-                    marker_color='#9c27b0',
-                    text=[f"{t:.1f}s" for t in game_time_df['time']],
-                    textposition='outside'
-                ))
-                fig_game_time.update_layout(
-                    title="Game Time by Team",
-                    xaxis_title="Total Game Time (s)",
-                    yaxis_title="",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_game_time, use_container_width=True)
-        
-        with col2:
-            # Game time histogram
-            if stats['game_times']:
-                fig_time_hist = go.Figure()
-                fig_time_hist.add_trace(go.Histogram(
-                    x=[g['time'] for g in stats['game_times']],
-                    nbinsx=15,
-                    marker_color='#9c27b0',
-                    opacity=0.8
-                ))
-                fig_time_hist.update_layout(
-                    title="Game Time Distribution",
-                    xaxis_title="Game Time (seconds)",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_time_hist, use_container_width=True)
-        
-        st.markdown('<div class="section-title">📦 DATA SIZE ANALYTICS</div>', unsafe_allow_html=True)
-        
-        # Data Size Stats
-        avg_data_size = np.mean(stats['data_sizes']) if stats['data_sizes'] else 0
-        min_data_size = min(stats['data_sizes']) if stats['data_sizes'] else 0
-        max_data_size = max(stats['data_sizes']) if stats['data_sizes'] else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_bytes = stats['total_data_size']
-            if total_bytes >= 1024:
-                size_str = f"{total_bytes/1024:.2f} KB"
-            else:
-                size_str = f"{total_bytes} B"
-            st.markdown(render_stat_card(size_str, "Total Data Sent", "cyan"), unsafe_allow_html=True)
-        with col2:
-            st.markdown(render_stat_card(f"{avg_data_size:.0f} B", "Avg Data/Game", "neutral"), unsafe_allow_html=True)
-        with col3:
-            st.markdown(render_stat_card(f"{min_data_size} B", "Min Data/Game", "win"), unsafe_allow_html=True)
-        with col4:
-            st.markdown(render_stat_card(f"{max_data_size} B", "Max Data/Game", "loss"), unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if stats['data_size_per_game']:
-                data_size_df = pd.DataFrame(stats['data_size_per_game'])
-                data_size_df = data_size_df.sort_values('size', ascending=True)
-                
-                fig_data_size = go.Figure()
-                fig_data_size.add_trace(go.Bar(
-                    x=data_size_df['size'],
-                    y=data_size_df['team'],
-                    orientation='h',
-                    marker_color='#ff9800',
-                    text=[f"{s} B" for s in data_size_df['size']],
-                    textposition='outside'
-                ))
-                fig_data_size.update_layout(
-                    title="Data Size by Team",
-                    xaxis_title="Data Size (bytes)",
-                    yaxis_title="",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_data_size, use_container_width=True)
-        
-        with col2:
-            if stats['data_sizes']:
-                fig_size_hist = go.Figure()
-                fig_size_hist.add_trace(go.Histogram(
-                    x=stats['data_sizes'],
-                    nbinsx=15,
-                    marker_color='#4caf50',
-                    opacity=0.8
-                ))
-                fig_size_hist.update_layout(
-                    title="Data Size Distribution",
-                    xaxis_title="Data Size (bytes)",
-                    yaxis_title="Frequency",
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='white',
-                    height=350
-                )
-                st.plotly_chart(fig_size_hist, use_container_width=True)
-    
-    # ==================== TAB 6: LEADERBOARD ====================
-    with tab6:
-        st.markdown('<div class="section-title">🏆 TEAM LEADERBOARD</div>', unsafe_allow_html=True)
-        
-        team_df = pd.DataFrame(stats['team_stats'])
-        team_df = team_df.sort_values(['win_rate', 'client_wins'], ascending=[False, False])
+            st.plotly_chart(fig_hits, use_container_width=True)
+    
+    with col2:
+        hit_categories = ['0 Hits\n(Stand)', '1 Hit', '2 Hits', '3+ Hits']
+        stand_rounds, one_hit, two_hits = (int(hits_hist[i]) if i < len(hits_hist) else 0 for i in range(3))
+        three_plus = int(hits_hist[3:].sum())
         
-        # Top 3 podium
-        if len(team_df) >= 3:
-            col1, col2, col3 = st.columns(3)
-            top3 = team_df.head(3).to_dict('records')
-            
-            with col1:
-                st.markdown(f"""
-                <div class="stat-card" style="border: 2px solid #c0c0c0;">
-                    <div style="font-size: 2rem;">🥈</div>
-                    <div class="stat-value" style="font-size: 1.5rem; color: #c0c0c0;">{top3[1]['team']}</div>
-                    <div class="stat-label">{top3[1]['win_rate']:.1f}% Win Rate</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="stat-card" style="border: 2px solid #ffd700;">
-                    <div style="font-size: 2.5rem;">🥇</div>
-                    <div class="stat-value" style="font-size: 1.8rem; color: #ffd700;">{top3[0]['team']}</div>
-                    <div class="stat-label">{top3[0]['win_rate']:.1f}% Win Rate</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div class="stat-card" style="border: 2px solid #cd7f32;">
-                    <div style="font-size: 2rem;">🥉</div>
-                    <div class="stat-value" style="font-size: 1.5rem; color: #cd7f32;">{top3[2]['team']}</div>
-                    <div class="stat-label">{top3[2]['win_rate']:.1f}% Win Rate</div>
-                </div>
-                """, unsafe_allow_html=True)
+        fig_hit_dist = go.Figure()
+        fig_hit_dist.add_trace(go.Bar(
+            x=hit_categories,
+            y=[stand_rounds, one_hit, two_hits, three_plus],
+            marker_color=['#4caf50', '#2196f3', '#ff9800', '#f44336'],
+            text=[stand_rounds, one_hit, two_hits, three_plus],
+            textposition='outside'
+        ))
+        fig_hit_dist.update_layout(
+            title="Player Decision Distribution",
+            xaxis_title="Strategy",
+            yaxis_title="Number of Rounds",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font_color='white',
+            height=350
+        )
+        st.plotly_chart(fig_hit_dist, use_container_width=True)
+
+
+def render_hand_values(stats: dict):
+    """Hand Values tab"""
+    st.markdown('<div class="section-title">🃏 HAND VALUE ANALYSIS</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if len(stats['client_hand_values']):
+            fig_hist_player = hand_value_hist(stats['client_hand_values'], "Player Final Hand Values", 'Player Hands', '#2196f3')
+            st.plotly_chart(fig_hist_player, use_container_width=True)
+    
+    with col2:
+        if len(stats['server_hand_values']):
+            fig_hist_dealer = hand_value_hist(stats['server_hand_values'], "Dealer Final Hand Values", 'Dealer Hands', '#9c27b0')
+            st.plotly_chart(fig_hist_dealer, use_container_width=True)
+    
+    # Average hand values
+    avg_player_hand = stats['client_hand_values'].mean() if len(stats['client_hand_values']) else 0
+    avg_dealer_hand = stats['server_hand_values'].mean() if len(stats['server_hand_values']) else 0
+    
+    max_player = int(stats['client_hand_values'].max()) if len(stats['client_hand_values']) else 0
+    blackjacks = int((stats['client_hand_values'] == 21).sum())
+    
+    st.markdown(render_stat_row([
+        (f"{avg_player_hand:.1f}", "Avg Player Hand", "neutral"),
+        (f"{avg_dealer_hand:.1f}", "Avg Dealer Hand", "purple"),
+        (max_player, "Max Player Hand", "win"),
+        (blackjacks, "Player Blackjacks", "cyan"),
+    ]), unsafe_allow_html=True)
+
+
+def render_cards(stats: dict):
+    """Cards tab"""
+    st.markdown('<div class="section-title">🎴 CARD STATISTICS</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(rank_bar(tuple(stats['rank_counts'].tolist())), use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(suit_pie(tuple(stats['suit_counts'].tolist())), use_container_width=True)
+    
+    # Card stats
+    rank_counts = stats['rank_counts']
+    ace_count = int(rank_counts[ACE_RANK_ID])
+    total_cards = stats['total_cards']
+    ace_frequency = (ace_count / total_cards * 100) if total_cards > 0 else 0
+    most_common_rank = list(RANK_IDS)[int(rank_counts.argmax())] if rank_counts.any() else 'N/A'
+    face_cards = int(sum(rank_counts[RANK_IDS[r]] for r in ['J', 'Q', 'K']))
+    
+    st.markdown(render_stat_row([
+        (total_cards, "Total Cards Dealt", "neutral"),
+        (f"{ace_frequency:.1f}%", "Ace Frequency", "loss"),
+        (most_common_rank, "Most Common Rank", "win"),
+        (face_cards, "Face Cards (J/Q/K)", "purple"),
+    ]), unsafe_allow_html=True)
+
+
+def render_time_and_data(stats: dict):
+    """Time & Data tab"""
+    st.markdown('<div class="section-title">⏱️ RESPONSE TIME ANALYSIS</div>', unsafe_allow_html=True)
+    
+    # Response time stats cards
+    if stats['response_time_summary'] is not None:
+        avg_rt, min_rt, max_rt, median_rt = stats['response_time_summary']
         
-        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown(render_stat_row([
+            (f"{avg_rt:.2f}s", "Avg Response Time", "cyan"),
+            (f"{min_rt:.2f}s", "Fastest Response", "win"),
+            (f"{max_rt:.2f}s", "Slowest Response", "loss"),
+            (f"{median_rt:.2f}s", "Median Response", "purple"),
+        ]), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if len(stats['response_times']):
+            st.plotly_chart(response_time_hist(stats['response_times']), use_container_width=True)
+    
+    with col2:
+        if not stats['avg_response_per_game'].empty:
+            st.plotly_chart(avg_response_bar(stats['avg_response_per_game']), use_container_width=True)
+    
+    st.markdown('<div class="section-title">🕐 GAME TIME ANALYTICS</div>', unsafe_allow_html=True)
+    
+    # Game Time Stats
+    game_times_values = stats['game_times']['time'].to_numpy(dtype=np.float64) if not stats['game_times'].empty else np.zeros(1)
+    avg_game_time = game_times_values.mean()
+    min_game_time = game_times_values.min()
+    max_game_time = game_times_values.max()
+    
+    st.markdown(render_stat_row([
+        (f"{stats['total_game_time']:.1f}s", "Total Game Time", "cyan"),
+        (f"{avg_game_time:.1f}s", "Avg Game Time", "neutral"),
+        (f"{min_game_time:.1f}s", "Fastest Game", "win"),
+        (f"{max_game_time:.1f}s", "Longest Game", "loss"),
+    ]), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Game time by team
+        if not stats['game_times'].empty:
+            st.plotly_chart(game_time_bar(stats['game_times']), use_container_width=True)
+    
+    with col2:
+        # Game time histogram
+        if not stats['game_times'].empty:
+            st.plotly_chart(game_time_hist(stats['game_times']['time']), use_container_width=True)
+    
+    st.markdown('<div class="section-title">📦 DATA SIZE ANALYTICS</div>', unsafe_allow_html=True)
+    
+    # Data Size Stats
+    avg_data_size, min_data_size, max_data_size = stats['data_size_summary']
+    
+    st.markdown(render_stat_row([
+        (stats['total_data_size_human'], "Total Data Sent", "cyan"),
+        (f"{avg_data_size:.0f} B", "Avg Data/Game", "neutral"),
+        (f"{min_data_size} B", "Min Data/Game", "win"),
+        (f"{max_data_size} B", "Max Data/Game", "loss"),
+    ]), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if not stats['data_size_per_game'].empty:
+            st.plotly_chart(data_size_bar(stats['data_size_per_game']), use_container_width=True)
+    
+    with col2:
+        if len(stats['data_sizes']):
+            st.plotly_chart(data_size_hist(stats['data_sizes']), use_container_width=True)
+
+
+def render_leaderboard(stats: dict):
+    """Leaderboard tab"""
+    st.markdown('<div class="section-title">🏆 TEAM LEADERBOARD</div>', unsafe_allow_html=True)
+    
+    team_df = stats['leaderboard']
+    
+    # Top 3 podium
+    if len(team_df) >= 3:
+        top3 = team_df.head(3).to_dict('records')
         
-        # Full leaderboard table
-        st.dataframe(
-            team_df[['team', 'client_wins', 'dealer_wins', 'ties', 'rounds', 'win_rate']].rename(columns={
-                'team': 'Team',
-                'client_wins': 'Client Wins',
-                'dealer_wins': 'Dealer Wins',
-                'ties': 'Ties',
-                'rounds': 'Rounds',
-                'win_rate': 'Win Rate %'
-            }).style.format({'Win Rate %': '{:.1f}'}).background_gradient(
-                subset=['Win Rate %'],
-                cmap='RdYlGn'
-            ),
-            use_container_width=True,
-            hide_index=True
-        )
+        st.markdown('<div class="stat-row">' + "".join(
+            PODIUM_CARD_TPL.format(team=top3[place]['team'], rate=top3[place]['win_rate'], **slot)
+            for place, slot in PODIUM_SLOTS
+        ) + '</div>', unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Full leaderboard table
+    st.dataframe(leaderboard_table(team_df), column_config=LEADERBOARD_COLUMN_CONFIG, use_container_width=True, hide_index=True)
+
+
+VIEWS = {
+    "📈 Overview": render_overview,
+    "🎯 Results": render_results,
+    "🃏 Hand Values": render_hand_values,
+    "🎴 Cards": render_cards,
+    "⏱️ Time & Data": render_time_and_data,
+    "🏆 Leaderboard": render_leaderboard,
+}
+
+
+def main():
+    st.set_page_config(
+        page_title="Blackjack Statistics",
+        page_icon="📊",
+        layout="wide"
+    )
+    
+    inject_css()
+    
+    # Title
+    st.markdown('<div class="main-title">📊 BLACKJACK STATISTICS</div>', unsafe_allow_html=True)
+    st.markdown('<div class="subtitle">GAME ANALYTICS DASHBOARD</div>', unsafe_allow_html=True)
+    
+    # Load and process data - reruns reuse the cached stats until the file changes
+    stats = load_stats(DATA_FILE, *data_file_version())
+    
+    if stats is None:
+        st.error("No data found. Please ensure db_mock.json is in the same directory.")
+        return
+    
+    # ==================== VIEWS ====================
+    # A radio instead of st.tabs: tabs run every tab body on each rerun, this only renders the selected view
+    view = st.radio("View", list(VIEWS), horizontal=True, label_visibility="collapsed", key="view")
+    VIEWS[view](stats)
     
     # Footer
     st.markdown("""
@@ -0,0 +1,45 @@
+"""
+Hand total kernels for the statistics dashboard
+
+Kept out of app.py because Streamlit re-executes the script on every rerun: a jitted function
+defined there would be recompiled each time and its on-disk cache could not be reloaded.
+Numba is optional - without it reduce_hands is the pure-NumPy reduction.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def reduce_hands_numpy(ranks: np.ndarray, bounds: np.ndarray, value_lut: np.ndarray, ace_id: int) -> np.ndarray:
+    """Hand totals from flattened rank ids, hand h spanning ranks[bounds[h]:bounds[h + 1]]"""
+    totals = np.add.reduceat(value_lut[ranks], bounds[:-1])
+    aces = np.add.reduceat((ranks == ace_id).astype(np.int64), bounds[:-1])
+    
+    # Each ace counted as 1 instead of 11 takes 10 off; demote just enough of them to get to 21 or below
+    demote = np.minimum(aces, np.maximum(0, (totals - 21 + 9) // 10))
+    return totals - 10 * demote
+
+
+def _reduce_hands_loop(ranks: np.ndarray, bounds: np.ndarray, value_lut: np.ndarray, ace_id: int) -> np.ndarray:
+    """Single pass over the flattened hands - only worth it compiled (see reduce_hands)"""
+    n_hands = len(bounds) - 1
+    totals = np.empty(n_hands, dtype=np.int64)
+    for h in range(n_hands):
+        total = 0
+        aces = 0
+        for k in range(bounds[h], bounds[h + 1]):
+            total += value_lut[ranks[k]]
+            if ranks[k] == ace_id:
+                aces += 1
+        while total > 21 and aces > 0:
+            total -= 10
+            aces -= 1
+        totals[h] = total
+    return totals
+
+
+reduce_hands = numba.njit(cache=True)(_reduce_hands_loop) if numba is not None else reduce_hands_numpy
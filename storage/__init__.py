@@ -1,4 +1,4 @@
 # storage/__init__.py
 # Storage modules
 # Import directly from submodules:
-#   from storage.wrapper import TinyDBWrapper
\ No newline at end of file
+#   from storage.wrapper import TinyDBWrapper, get_db
\ No newline at end of file
@@ -1,41 +1,70 @@
+import atexit
+import functools
+import os
+import queue
 import threading
+import orjson
 from tinydb import TinyDB, Query
 from tinydb.storages import JSONStorage
 from tinydb.middlewares import CachingMiddleware
 
-class TinyDBWrapper:
+from shared.logger import get_logger
+
+class FastJSONStorage(JSONStorage):
+    # Input: path (str), access_mode (str), **kwargs
+    # Output: storage instance
+    # Description: JSONStorage that (de)serializes the database file with orjson instead of the stdlib json module.
+    def __init__(self, path: str, access_mode: str = "rb+", **kwargs):
+        super().__init__(path, access_mode=access_mode, **kwargs)
+
     # Input: none
-    # Output: singleton instances per (path, table_name)
-    # Description: Thread-safe singleton wrapper around TinyDB.
-    _instances: dict[tuple[str, str], "TinyDBWrapper"] = {}
-    _instances_lock = threading.Lock()
+    # Output: database dict or None for an empty file
+    # Description: Reads and parses the whole database file.
+    def read(self):
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            return None
+        self._handle.seek(0)
+        return orjson.loads(self._handle.read())
 
-    # Input: path (str), table_name (str)
-    # Output: TinyDBWrapper instance
-    # Description: Ensures only one instance exists per database path and table.
-    def __new__(cls, path: str = "data\\db.json", table_name: str = "games"):
-        key = (path, table_name)
-        with cls._instances_lock:
-            if key not in cls._instances:
-                inst = super().__new__(cls)
-                cls._instances[key] = inst
-                inst._initialized = False
-            return cls._instances[key]
+    # Input: data (dict)
+    # Output: none
+    # Description: Serializes the database state and rewrites the file in place.
+    def write(self, data):
+        self._handle.seek(0)
+        # Game documents use the integer result constants as keys, stored as strings like the json module does
+        self._handle.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
+
+# Input: document (dict)
+# Output: none
+# Description: Raises TypeError if the document cannot be written by FastJSONStorage.
+#              Checked once before a document is queued, because the cached table is only serialized on flush
+#              and a bad document that reached the cache would make every later flush fail.
+def _check_serializable(document: dict) -> None:
+    try:
+        orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as ex:
+        raise TypeError(f"document cannot be serialized: {ex}") from ex
 
+class TinyDBWrapper:
     # Input: path (str), table_name (str)
     # Output: none
-    # Description: Initializes TinyDB connection and table if not already initialized.
+    # Description: Opens the TinyDB database and table and starts the background writer.
     def __init__(self, path: str = "data\\db.json", table_name: str = "games"):
-        if getattr(self, "_initialized", False):
-            return
-
-        self._db = TinyDB(path, storage=CachingMiddleware(JSONStorage))
+        self._db = TinyDB(path, storage=CachingMiddleware(FastJSONStorage))
         self._table = self._db.table(table_name)
         self._Q = Query()
 
         self._lock = threading.RLock()
 
-        self._initialized = True
+        # Documents from insert_async are written by a single background thread, off the callers' paths
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name="tinydb-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.wait_for_writes)
 
     # Input: document (dict)
     # Output: document ID (int)
@@ -46,6 +75,67 @@ class TinyDBWrapper:
         with self._lock:
             return self._table.insert(document)
         
+    # Input: document (dict)
+    # Output: none
+    # Description: Queues a document for the background writer thread and returns immediately.
+    #              Raises TypeError up front for a document the writer could not store.
+    def insert_async(self, document: dict) -> None:
+        if not isinstance(document, dict):
+            raise TypeError("document must be a dict")
+        _check_serializable(document)
+        self._queue.put(document)
+
+    # Input: none
+    # Output: none
+    # Description: Blocks until every queued document has been written and flushed.
+    def wait_for_writes(self) -> None:
+        self._queue.join()
+
+    # Input: none
+    # Output: none (runs forever on the writer thread)
+    # Description: Writes queued documents in batches, flushing once per batch.
+    def _drain(self) -> None:
+        while True:
+            documents = [self._queue.get()]
+            while True:
+                try:
+                    documents.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._insert_batch(documents)
+                self.flush()
+            except Exception as ex:
+                get_logger().error("Error at writing %s document(s) to the database: with %s", len(documents), ex)
+            finally:
+                for _ in documents:
+                    self._queue.task_done()
+
+    # Input: documents (list of dict)
+    # Output: none
+    # Description: Inserts a queued batch at once, falling back to one insert per document if the batch is rejected
+    #              so a single bad document does not discard the rest.
+    def _insert_batch(self, documents: list[dict]) -> None:
+        try:
+            self.insert_many(documents)
+        except TypeError:
+            # Raised by insert_many's check, before anything reached the table. Any later failure may have written
+            # part of the batch already and is left to the caller - retrying it would insert those documents twice
+            for document in documents:
+                try:
+                    self.insert(document)
+                except Exception as ex:
+                    get_logger().error("Error at writing a document to the database, dropping it: with %s", ex)
+
+    # Input: documents (list of dict)
+    # Output: list of document IDs
+    # Description: Inserts several documents into the table under a single lock acquisition.
+    def insert_many(self, documents: list[dict]) -> list[int]:
+        if not all(isinstance(document, dict) for document in documents):
+            raise TypeError("documents must be dicts")
+        with self._lock:
+            return self._table.insert_multiple(documents)
+
     # Input: none
     # Output: none
     # Description: Flushes cached data to disk.
@@ -60,4 +150,24 @@ class TinyDBWrapper:
     # Description: Closes the database connection.
     def close(self) -> None:
         with self._lock:
-            self._db.close()
\ No newline at end of file
+            self._db.close()
+
+
+_get_db_lock = threading.Lock()
+
+
+# Input: path (str), table_name (str)
+# Output: TinyDBWrapper instance
+# Description: Returns the single shared wrapper per database path and table, creating it on first use.
+#              The path is normalized first, so every spelling of the same file maps to one wrapper.
+def get_db(path: str = "data\\db.json", table_name: str = "games") -> TinyDBWrapper:
+    with _get_db_lock:
+        return _get_db(os.path.abspath(path), table_name)
+
+
+# Input: path (absolute str), table_name (str)
+# Output: TinyDBWrapper instance
+# Description: Cached constructor behind get_db - always called positionally with normalized arguments.
+@functools.lru_cache(maxsize=None)
+def _get_db(path: str, table_name: str) -> TinyDBWrapper:
+    return TinyDBWrapper(path, table_name)
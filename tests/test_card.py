@@ -0,0 +1,26 @@
+import unittest
+
+from shared.card import CARDS, Card
+
+
+class CardDecodeTest(unittest.TestCase):
+    def test_every_card_round_trips_through_one_byte(self):
+        for card in CARDS:
+            with self.subTest(card=str(card)):
+                encoded = card.encode_to_bytes()
+                self.assertEqual(len(encoded), 1)
+                self.assertIs(Card.decode_from_bytes(encoded), card)
+                self.assertEqual(Card.decode_dict(encoded), {"rank": card.rank, "suit": card.suit, "value": card.value})
+        self.assertEqual(len({card.encode_to_bytes() for card in CARDS}), 52)
+
+    def test_invalid_rank_byte_is_rejected(self):
+        # rank index 13 (one past 'A') with suit 0 - must not wrap around to a card of the next suit
+        bad_byte = bytes([13 << 2])
+        with self.assertRaises(ValueError):
+            Card.decode_from_bytes(bad_byte)
+        with self.assertRaises(IndexError):
+            Card.decode_dict(bad_byte)
+
+
+if __name__ == "__main__":
+    unittest.main()